@@ -0,0 +1,441 @@
+#benchmark.py
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import subprocess
+import concurrent.futures
+from statistics import quantiles
+
+import numpy as np
+import pandas as pd
+
+import data_insertion
+from data_insertion import (
+    COURSES, SCHEMA_INDEXES, STUDENT_BULK_INSERT_SQL, PROGRAMMING_INSERT_SQL,
+    SOFT_SKILLS_INSERT_SQL, PLACEMENT_INSERT_SQL, generate_shard
+)
+from queries import (
+    CRITERIA_SQL, INSIGHT_QUERIES, STUDENT_STORE_SQL,
+    OVERVIEW_COUNTS_SQL, BATCH_ROLLUP_SQL, PACKAGE_ROLLUP_SQL, ROLLUP_COLUMNS,
+    batch_rollup_select_sql, package_rollup_select_sql
+)
+from frames import build_frame
+from scoring import FEATURES, FEATURE_SCALES, READINESS_WEIGHTS
+from student_store import StudentStore
+from rollups import batch_summary
+
+# Criteria filter thresholds benchmarked for every course:
+# CodeKata problems, mini projects, soft skill average
+CRITERIA_GRID = [
+    (codekata, projects, softskills)
+    for codekata in (50, 150, 250, 400)
+    for projects in (5, 8)
+    for softskills in (50, 60, 70, 85)
+]
+
+# SQLite stand-in for the MySQL schema created by data_insertion.py
+SQLITE_SCHEMA = [
+    """
+    CREATE TABLE students (
+        student_id INTEGER PRIMARY KEY, name TEXT, age INTEGER, gender TEXT,
+        email TEXT, phone TEXT, enrollment_year INTEGER, course_batch TEXT,
+        city TEXT, graduation_year INTEGER
+    )
+    """,
+    """
+    CREATE TABLE programming (
+        programming_id TEXT PRIMARY KEY, student_id INTEGER, language TEXT,
+        problems_solved INTEGER, assessments_completed INTEGER, mini_projects INTEGER,
+        certifications_earned INTEGER, latest_project_score INTEGER
+    )
+    """,
+    """
+    CREATE TABLE soft_skills (
+        soft_skill_id TEXT PRIMARY KEY, student_id INTEGER, communication INTEGER,
+        teamwork INTEGER, presentation INTEGER, leadership INTEGER,
+        critical_thinking INTEGER, interpersonal_skills INTEGER,
+        soft_skill_avg REAL GENERATED ALWAYS AS (ROUND((communication + teamwork + presentation +
+            leadership + critical_thinking + interpersonal_skills) / 6.0, 2)) STORED
+    )
+    """,
+    """
+    CREATE TABLE placements (
+        placement_id TEXT PRIMARY KEY, student_id INTEGER, mock_interview_score INTEGER,
+        internships_completed INTEGER, placement_status TEXT, company_name TEXT,
+        placement_package TEXT, interview_rounds_cleared INTEGER, placement_date TEXT,
+        package_lpa REAL GENERATED ALWAYS AS (
+            CAST(NULLIF(TRIM(REPLACE(placement_package, 'LPA', '')), '') AS REAL)) STORED
+    )
+    """,
+    """
+    CREATE TABLE batch_rollup (
+        course_batch TEXT, enrollment_year INTEGER, placement_status TEXT,
+        students INTEGER, problems_count INTEGER, problems_sum REAL,
+        problems_min INTEGER, problems_max INTEGER, soft_skill_count INTEGER, soft_skill_sum REAL,
+        PRIMARY KEY (course_batch, enrollment_year, placement_status)
+    )
+    """,
+    """
+    CREATE TABLE package_rollup (
+        course_batch TEXT, enrollment_year INTEGER, placement_status TEXT,
+        package_tenths INTEGER, students INTEGER,
+        PRIMARY KEY (course_batch, enrollment_year, placement_status, package_tenths)
+    )
+    """
+]
+
+
+def to_sqlite(query):
+    """Translates the MySQL dialect used in queries.py to SQLite."""
+    return (query.replace('%s', '?')
+                 .replace('YEAR(CURDATE())', "CAST(strftime('%Y', 'now') AS INTEGER)"))
+
+
+def readiness_sql(weights):
+    """The student store's readiness score as one ORDER BY ... LIMIT query, the SQL baseline for top_k()."""
+    weights = {**READINESS_WEIGHTS, **weights}
+    total = sum(weights[name] for name in FEATURES)
+    score = ' + '.join(f"COALESCE({name}, 0) * {weights[name] * 100 / total / FEATURE_SCALES[name]!r}"
+                       for name in FEATURES if weights[name])
+    return f'''
+        SELECT s.student_id, {score} AS readiness_score
+        FROM students s
+        JOIN programming p ON s.student_id = p.student_id
+        JOIN soft_skills ss ON s.student_id = ss.student_id
+        JOIN placements pl ON s.student_id = pl.student_id
+        ORDER BY readiness_score DESC
+        LIMIT %s
+    '''
+
+
+def percentiles(samples):
+    """p50/p95/p99 and mean of a list of durations, in milliseconds."""
+    if len(samples) == 1:
+        p50 = p95 = p99 = samples[0]
+    else:
+        cuts = quantiles(samples, n=100, method='inclusive')
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    return {
+        'runs': len(samples),
+        'p50_ms': round(p50 * 1000, 3),
+        'p95_ms': round(p95 * 1000, 3),
+        'p99_ms': round(p99 * 1000, 3),
+        'mean_ms': round(sum(samples) / len(samples) * 1000, 3)
+    }
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class SqliteTarget:
+    """Benchmark target backed by an in-memory SQLite database."""
+
+    name = 'sqlite'
+
+    def __init__(self):
+        self.conn = sqlite3.connect(':memory:')
+        for statement in SQLITE_SCHEMA:
+            self.conn.execute(statement)
+        for table, index, definition in SCHEMA_INDEXES:
+            kind, columns = definition.split(' ', 1)
+            unique = 'UNIQUE ' if kind == 'UNIQUE' else ''
+            self.conn.execute(f"CREATE {unique}INDEX {index} ON {table} {columns}")
+
+    def write_batch(self, students, programming, soft_skills, placements):
+        self.conn.executemany(to_sqlite(STUDENT_BULK_INSERT_SQL), students)
+        self.conn.executemany(to_sqlite(PROGRAMMING_INSERT_SQL), programming)
+        self.conn.executemany(to_sqlite(SOFT_SKILLS_INSERT_SQL), soft_skills)
+        self.conn.executemany(to_sqlite(PLACEMENT_INSERT_SQL), placements)
+        self.conn.commit()
+
+    def analyze(self):
+        self.conn.execute("ANALYZE")
+
+    def build_rollups(self):
+        # A full build; the loader's incremental merge needs MySQL's ON DUPLICATE KEY UPDATE
+        for table, select_sql in (('batch_rollup', batch_rollup_select_sql),
+                                  ('package_rollup', package_rollup_select_sql)):
+            columns = ', '.join(column for names in ROLLUP_COLUMNS[table] for column in names)
+            self.conn.execute(f"INSERT INTO {table} ({columns}) {select_sql()}")
+        self.conn.commit()
+
+    def execute(self, query, params=()):
+        cursor = self.conn.execute(to_sqlite(query), params)
+        columns = [column[0] for column in cursor.description]
+        return columns, cursor.fetchall()
+
+
+class MySQLTarget:
+    """
+    Benchmark target on a MySQL/MariaDB server. Uses its own database, which
+    is dropped and recreated, so it never touches the app's data.
+    """
+
+    name = 'mysql'
+
+    def __init__(self, database):
+        if database == data_insertion.DB_CONFIG['database']:
+            raise ValueError("Refusing to benchmark against the application database")
+        import mysql.connector
+        config = {key: value for key, value in data_insertion.DB_CONFIG.items() if key != 'database'}
+        conn = mysql.connector.connect(**config)
+        cur = conn.cursor()
+        cur.execute(f"DROP DATABASE IF EXISTS `{database}`")
+        cur.execute(f"CREATE DATABASE `{database}`")
+        conn.close()
+
+        self.generator = data_insertion.PlacementDataGenerator({**config, 'database': database})
+        self.generator.create_tables()
+        self.conn = self.generator.conn
+
+    def write_batch(self, students, programming, soft_skills, placements):
+        self.generator.write_batch(students, programming, soft_skills, placements)
+
+    def analyze(self):
+        cur = self.conn.cursor()
+        cur.execute("ANALYZE TABLE students, programming, soft_skills, placements")
+        cur.fetchall()
+        cur.close()
+
+    def build_rollups(self):
+        self.generator.rebuild_rollups()
+
+    def execute(self, query, params=()):
+        cur = self.conn.cursor()
+        cur.execute(query, params or None)
+        columns = [column[0] for column in cur.description]
+        rows = cur.fetchall()
+        cur.close()
+        return columns, rows
+
+
+def run_size(size, args):
+    """Runs every benchmark for one cohort size; executed in a fresh process so peak RSS is per size."""
+    target = MySQLTarget(args.mysql_database) if args.backend == 'mysql' else SqliteTarget()
+    results = {}
+
+    # Generation + load throughput with the loader's own row generator
+    shards = [(args.seed, offset, min(args.batch_size, size - offset), 1)
+              for offset in range(0, size, args.batch_size)]
+    started = time.perf_counter()
+    if args.workers > 1:
+        import multiprocessing
+        with multiprocessing.Pool(args.workers) as pool:
+            for rows in pool.imap(generate_shard, shards):
+                target.write_batch(*rows)
+    else:
+        for shard in shards:
+            target.write_batch(*generate_shard(shard))
+    elapsed = time.perf_counter() - started
+    target.analyze()
+    started = time.perf_counter()
+    target.build_rollups()
+    rollup_build = time.perf_counter() - started
+    results['populate'] = {'students': size, 'seconds': round(elapsed, 3),
+                           'students_per_sec': round(size / elapsed, 1), 'workers': args.workers}
+
+    # Every insight as the MySQL engine runs it
+    results['insights'] = {
+        name: timed(lambda query=query: target.execute(query), args.repeat)
+        for name, query in INSIGHT_QUERIES.items()
+    }
+
+    # Analytics served from the rollup tables (one row per group)
+    def batch_analytics():
+        columns, rows = target.execute(BATCH_ROLLUP_SQL)
+        groups = build_frame(columns, [rows])
+        columns, rows = target.execute(PACKAGE_ROLLUP_SQL)
+        return batch_summary(groups, build_frame(columns, [rows]))
+    results['rollups'] = {
+        'build_ms': round(rollup_build * 1000, 3),
+        'overview_counts': timed(lambda: target.execute(OVERVIEW_COUNTS_SQL), args.repeat),
+        'batch_analytics': timed(batch_analytics, args.repeat)
+    }
+
+    # Resident student store: build time and size
+    _, cohort = target.execute(STUDENT_STORE_SQL)
+    store = StudentStore()
+    started = time.perf_counter()
+    store.upsert_rows(cohort)
+    store_build = time.perf_counter() - started
+    del cohort
+    results['student_store'] = {'build_ms': round(store_build * 1000, 3), **store.stats()}
+
+    # Criteria filter in SQL and through the student store
+    sql_samples, store_samples = [], []
+    for course in COURSES:
+        for codekata, projects, softskills in CRITERIA_GRID:
+            params = (course, codekata, projects, softskills)
+            started = time.perf_counter()
+            target.execute(CRITERIA_SQL, params)
+            sql_samples.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            store.filter(*params)
+            store_samples.append(time.perf_counter() - started)
+    results['criteria_filter'] = {
+        'sql': percentiles(sql_samples),
+        'student_store': percentiles(store_samples)
+    }
+
+    # Bulk drive matching: every grid criteria set as one drive, matched in
+    # one pass vs one store.filter() per drive merged into the same pairs
+    drives = [(course, *criteria) for course in COURSES for criteria in CRITERIA_GRID]
+
+    def sequential_matches():
+        matches = [store.filter(*drive) for drive in drives]
+        student_ids = np.concatenate(matches)
+        drive_indexes = np.repeat(np.arange(len(drives)), [len(ids) for ids in matches])
+        order = np.argsort(student_ids, kind='stable')
+        return student_ids[order], drive_indexes[order]
+
+    results['drive_matching'] = {
+        'drives': len(drives),
+        'pairs': len(store.match_drives(drives)[0]),
+        'match_drives': timed(lambda: store.match_drives(drives), args.repeat),
+        'sequential_filter': timed(sequential_matches, args.repeat)
+    }
+
+    # DataFrame construction from the widest result: dict rows vs typed columns
+    columns, rows = target.execute(INSIGHT_QUERIES["Join all student tables"])
+    dict_rows = [dict(zip(columns, row)) for row in rows]
+    results['dataframe_build'] = {
+        'rows': len(rows),
+        'from_dicts': timed(lambda: pd.DataFrame(dict_rows), args.repeat),
+        'typed_columns': timed(lambda: build_frame(columns, [rows]), args.repeat),
+        'from_dicts_mb': round(pd.DataFrame(dict_rows).memory_usage(deep=True).sum() / 2 ** 20, 2),
+        'typed_columns_mb': round(build_frame(columns, [rows]).memory_usage(deep=True).sum() / 2 ** 20, 2)
+    }
+    del dict_rows, rows
+
+    # Readiness re-ranking with fresh weights
+    weights = {'problems_solved': 0.3}
+    results['readiness_top_k'] = {
+        'sql': timed(lambda: target.execute(readiness_sql(weights), (5,)), args.repeat),
+        'student_store': timed(lambda: store.top_k(5, weights), args.repeat)
+    }
+
+    results['peak_rss_mb'] = peak_rss_mb()
+    return results
+
+
+# Startup probe, run with `python -c` in a fresh interpreter: benchmark.py
+# itself has already imported pandas. argv: app directory, reruns
+STARTUP_PROBE = """
+import os, sys, json, time
+os.environ['PLACEMENT_BACKEND'] = 'csv'
+sys.path.insert(0, sys.argv[1])
+import streamlit  # loaded before the app in real use, so not counted
+
+started = time.perf_counter()
+import placement_app  # module-level code only; main() is not run
+import_seconds = time.perf_counter() - started
+loaded = {name: name in sys.modules for name in ('pandas', 'numpy', 'pymysql')}
+
+from streamlit.testing.v1 import AppTest
+# The harness does one-time setup on its first run; keep it out of the numbers
+AppTest.from_string("import streamlit as st").run()
+app = AppTest.from_file(os.path.join(sys.argv[1], 'placement_app.py'), default_timeout=120)
+started = time.perf_counter()
+app.run()
+first_run = time.perf_counter() - started
+if app.exception:
+    raise SystemExit(app.exception[0].message)
+
+reruns = []
+for _ in range(int(sys.argv[2])):
+    started = time.perf_counter()
+    app.run()
+    reruns.append(time.perf_counter() - started)
+print(json.dumps({'import_seconds': import_seconds, 'loaded': loaded, 'first_run': first_run,
+                  'reruns': reruns, 'pymysql_loaded': 'pymysql' in sys.modules}))
+"""
+
+
+def run_startup(repeat):
+    """
+    Startup cost of placement_app.py on the CSV backend: importing the
+    script's module-level code, the first (cold) run of the whole script and
+    the reruns Streamlit does on every interaction.
+    """
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    probe = subprocess.run([sys.executable, '-c', STARTUP_PROBE, app_dir, str(repeat)],
+                           capture_output=True, text=True)
+    if probe.returncode:
+        raise RuntimeError(probe.stderr.strip().splitlines()[-1])
+    result = json.loads(probe.stdout.strip().splitlines()[-1])
+    return {
+        'import_ms': round(result['import_seconds'] * 1000, 3),
+        'loaded_at_import': result['loaded'],
+        'first_run_ms': round(result['first_run'] * 1000, 3),
+        'rerun': percentiles(result['reruns']),
+        'pymysql_loaded': result['pymysql_loaded']
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+# Main execution block
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the placement app's generation and query hot paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000],
+                        help="cohort sizes (students) to benchmark")
+    parser.add_argument('--backend', choices=['sqlite', 'mysql'], default='sqlite',
+                        help="embedded SQLite stand-in or a local MySQL/MariaDB server")
+    parser.add_argument('--mysql-database', default='placement_bench',
+                        help="scratch database for --backend mysql (dropped and recreated)")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per query")
+    parser.add_argument('--batch-size', type=int, default=5000, help="students per generated shard")
+    parser.add_argument('--workers', type=int, default=1, help="processes generating data")
+    parser.add_argument('--seed', type=int, default=0, help="base seed for the generator")
+    parser.add_argument('--startup', action='store_true',
+                        help="only measure the app's cold start and rerun overhead (CSV backend)")
+    parser.add_argument('--output', default='-', help="JSON report path ('-' for stdout)")
+    args = parser.parse_args()
+
+    report = {
+        'commit': git_commit(),
+        'backend': args.backend,
+        'python': sys.version.split()[0],
+        'repeat': args.repeat,
+        'results': {}
+    }
+    if args.startup:
+        print("⏱️  benchmarking app startup...", file=sys.stderr)
+        report['results']['startup'] = run_startup(args.repeat)
+    for size in ([] if args.startup else args.sizes):
+        print(f"⏱️  benchmarking {size} students...", file=sys.stderr)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            report['results'][str(size)] = executor.submit(run_size, size, args).result()
+
+    output = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(output)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+        print(f"✅ Report written to {args.output}", file=sys.stderr)
@@ -0,0 +1,207 @@
+#csv_engine.py
+import os
+import datetime
+import argparse
+import pandas as pd
+from frames import apply_dtypes
+from student_store import StudentStore, STORE_COLUMNS
+from scoring import FEATURES
+from rollups import rollup_frames, batch_summary
+
+# Table name -> file prefix of the exported tables shipped with the repo
+TABLE_FILES = {
+    'students': 'students_table',
+    'programming': 'programming_table',
+    'soft_skills': 'softskills_table',
+    'placements': 'placements_table'
+}
+
+SOFT_SKILL_COLUMNS = [
+    'communication', 'teamwork', 'presentation',
+    'leadership', 'critical_thinking', 'interpersonal_skills'
+]
+
+
+def read_table(data_dir, table):
+    """
+    Reads one exported table, preferring a Parquet copy when present.
+    The CSV exports write missing values as the literal string NULL.
+    """
+    base = os.path.join(data_dir, TABLE_FILES[table])
+    if os.path.exists(base + '.parquet'):
+        return pd.read_parquet(base + '.parquet')
+    # phone keeps its leading zeros as text
+    return pd.read_csv(base + '.csv', na_values=['NULL'], keep_default_na=False, dtype={'phone': str})
+
+
+def convert_to_parquet(data_dir):
+    """
+    Writes a Parquet copy next to each CSV export (requires pyarrow).
+    """
+    for table, prefix in TABLE_FILES.items():
+        base = os.path.join(data_dir, prefix)
+        frame = pd.read_csv(base + '.csv', na_values=['NULL'], keep_default_na=False, dtype={'phone': str})
+        frame.to_parquet(base + '.parquet', index=False)
+        print(f"✅ {table}: {len(frame)} rows -> {base}.parquet")
+
+
+class CsvEngine:
+    """
+    Offline data engine that answers every placement_app view from the
+    exported tables, loaded once into memory. Mirrors the result columns of
+    the SQL in queries.py so the views can use either backend.
+    """
+
+    def __init__(self, data_dir='.'):
+        students = read_table(data_dir, 'students')
+        programming = read_table(data_dir, 'programming')
+        soft_skills = read_table(data_dir, 'soft_skills')
+        placements = read_table(data_dir, 'placements')
+
+        # One joined frame per student, equivalent to the four-way JOIN
+        cohort = (students
+                  .merge(programming, on='student_id')
+                  .merge(soft_skills, on='student_id')
+                  .merge(placements, on='student_id'))
+        skill_sum = cohort[SOFT_SKILL_COLUMNS].sum(axis=1)
+        cohort['soft_skill_avg'] = (skill_sum / 6.0).round(2)
+        cohort = apply_dtypes(cohort)
+        # Sorted by student_id so keyset pages are a binary search away
+        self.cohort = cohort.sort_values('student_id', ignore_index=True)
+        cohort = self.cohort
+
+        # Same order as COURSES_SQL
+        self.course_list = sorted(cohort['course_batch'].dropna().unique().tolist())
+
+        # Rollups as the loader keeps them in MySQL; like the overview they
+        # are fixed for the lifetime of the engine
+        self.rollup_groups, self.rollup_packages = rollup_frames(cohort)
+        self.batch_rollup = batch_summary(self.rollup_groups, self.rollup_packages)
+        self.overview_counts = (self.rollup_groups
+                                .groupby(['course_batch', 'placement_status'], as_index=False, observed=True)
+                                ['students'].sum())
+
+        # Compact store behind the criteria filter and readiness ranking;
+        # package_lpa is the parsed placement_package here
+        store_columns = cohort.rename(columns={'placement_package': 'package_lpa'})
+        self.store = StudentStore()
+        self.store.upsert_rows(zip(*(store_columns[name].to_numpy(dtype=object, na_value=None)
+                                     for name in STORE_COLUMNS)))
+
+        self.insights = {
+            "Top 5 students ready for placement": self._top_ready,
+            "Distribution of soft skills scores": self._soft_skill_distribution,
+            "Top 20 performing students in mock interview": self._top_mock_interview,
+            "Top 10 students with highest package": self._top_package,
+            "Students with more than 4 certificates": self._many_certificates,
+            "Join all student tables": self._all_tables,
+            "Top mini project performers": self._top_mini_projects,
+            "Students graduating this year": self._graduating_this_year,
+            "Students with more than 2 internships": self._many_internships,
+            "Average programming performance per batch": self._avg_per_batch
+        }
+        self._insight_results = {}
+
+    # ----------------------------- OVERVIEW -----------------------------
+    def courses(self):
+        return self.course_list
+
+    def overview(self):
+        return self.overview_counts
+
+    def overview_students(self, course, status):
+        rows = self.cohort[(self.cohort['course_batch'] == course) & (self.cohort['placement_status'] == status)]
+        columns = ['student_id', 'name', 'email', 'phone', 'company_name', 'placement_package']
+        return rows[columns].reset_index(drop=True)
+
+    def batch_analytics(self):
+        return self.batch_rollup
+
+    # ----------------------------- FILTER BY CRITERIA -----------------------------
+    def student_store(self):
+        return self.store
+
+    def filter_students(self, course, codekata, projects, softskills_min):
+        student_ids = self.store.filter(course, codekata, projects, softskills_min)
+        if not len(student_ids):
+            return pd.DataFrame()
+        # The cohort is sorted by student_id, so rows are found by binary search
+        rows = self.cohort.iloc[self.cohort['student_id'].searchsorted(student_ids)]
+        columns = ['student_id', 'name', 'email', 'phone', 'course_batch',
+                   'language', 'problems_solved', 'mini_projects',
+                   *SOFT_SKILL_COLUMNS, 'soft_skill_avg', 'placement_status']
+        return rows[columns].reset_index(drop=True)
+
+    # ----------------------------- INSIGHTS -----------------------------
+    def insight(self, name):
+        # The data never changes after load, so each insight is computed once
+        if name not in self._insight_results:
+            self._insight_results[name] = self.insights[name]().reset_index(drop=True)
+        return self._insight_results[name]
+
+    def readiness_top_k(self, k, weights=None, status=None):
+        student_ids, scores = self.store.top_k(k, weights, status)
+        columns = ['student_id', 'name', 'course_batch', 'placement_status', *FEATURES]
+        rows = self.cohort.iloc[self.cohort['student_id'].searchsorted(student_ids)]
+        return rows[columns].reset_index(drop=True).assign(readiness_score=scores)
+
+    def insight_page(self, name, after_id, limit):
+        rows = self.insight(name)
+        start = rows['student_id'].searchsorted(after_id, side='right')
+        return rows.iloc[start:start + limit].reset_index(drop=True)
+
+    def _top_ready(self):
+        ready = self.cohort[self.cohort['placement_status'] == 'Ready']
+        ready = ready.sort_values(['soft_skill_avg', 'problems_solved'], ascending=False).head(5)
+        return ready[['student_id', 'name', 'course_batch', 'soft_skill_avg', 'problems_solved']]
+
+    def _soft_skill_distribution(self):
+        return self.cohort[['student_id', 'name', *SOFT_SKILL_COLUMNS]]
+
+    def _top_mock_interview(self):
+        top = self.cohort.sort_values('mock_interview_score', ascending=False).head(20)
+        return top[['student_id', 'name', 'mock_interview_score']]
+
+    def _top_package(self):
+        placed = self.cohort[self.cohort['placement_status'] == 'Placed']
+        # placement_package is parsed to LPA by apply_dtypes, so this sorts numerically
+        top = placed.sort_values('placement_package', ascending=False).head(10)
+        return top[['student_id', 'name', 'company_name', 'placement_package']]
+
+    def _many_certificates(self):
+        rows = self.cohort[self.cohort['certifications_earned'] > 4]
+        return rows[['student_id', 'name', 'certifications_earned']]
+
+    def _all_tables(self):
+        return self.cohort[['student_id', 'name', 'email', 'course_batch',
+                            'language', 'problems_solved', 'certifications_earned',
+                            *SOFT_SKILL_COLUMNS,
+                            'placement_status', 'company_name', 'placement_package']]
+
+    def _top_mini_projects(self):
+        rows = self.cohort[self.cohort['mini_projects'].isin([9, 10])]
+        return rows[['student_id', 'name', 'mini_projects']]
+
+    def _graduating_this_year(self):
+        rows = self.cohort[self.cohort['graduation_year'] == datetime.date.today().year]
+        return rows[['student_id', 'name', 'graduation_year']]
+
+    def _many_internships(self):
+        rows = self.cohort[self.cohort['internships_completed'] > 2]
+        return rows[['student_id', 'name', 'internships_completed']]
+
+    def _avg_per_batch(self):
+        sums = (self.rollup_groups
+                .groupby('course_batch', as_index=False, observed=True)
+                [['problems_sum', 'problems_count']].sum())
+        sums = sums[sums['problems_count'] > 0]
+        avg = (sums['problems_sum'] / sums['problems_count']).round(2)
+        return sums[['course_batch']].assign(avg_problems=avg.astype('float64'))
+
+
+# Main execution block
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert the exported CSV tables to Parquet")
+    parser.add_argument('--data-dir', default='.', help="directory holding the *_table.csv files")
+    args = parser.parse_args()
+    convert_to_parquet(args.data_dir)
@@ -0,0 +1,181 @@
+#csv_tools.py
+import os
+import csv
+import time
+import itertools
+import argparse
+
+import pandas as pd
+
+from data_insertion import DB_CONFIG, TABLE_COLUMNS, PlacementDataGenerator, id_ranges
+from csv_engine import TABLE_FILES
+from frames import INT_COLUMNS
+from queries import INSIGHT_QUERIES
+
+# Parents first so foreign keys resolve when importing everything
+TABLE_ORDER = ['students', 'programming', 'soft_skills', 'placements']
+
+
+def csv_dtypes(table):
+    """
+    Explicit read_csv dtypes: nullable Int64 for the numeric columns, text
+    for the rest. Not the app's compact dtypes: the columns are INT in MySQL
+    and pandas would silently wrap e.g. 200 to -56 in an Int8.
+    """
+    return {column: 'Int64' if column in INT_COLUMNS else 'string' for column in TABLE_COLUMNS[table]}
+
+
+def import_table(generator, table, csv_path, chunk_size=100000):
+    """
+    Streams a *_table.csv file into MySQL in chunks of chunk_size rows,
+    with one multi-row executemany and one commit per chunk. The file is
+    never held in memory as a whole. Returns the number of rows imported.
+    """
+    columns = TABLE_COLUMNS[table]
+    insert_sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    key_position = columns.index('student_id')
+
+    imported, ranges = 0, []
+    started = time.perf_counter()
+    chunks = pd.read_csv(csv_path, usecols=columns, dtype=csv_dtypes(table), chunksize=chunk_size,
+                         na_values=['NULL'], keep_default_na=False)
+    # Child rows may arrive before their student when tables are loaded separately
+    generator.cur.execute("SET FOREIGN_KEY_CHECKS = 0")
+    try:
+        for chunk in chunks:
+            values = chunk[columns].to_numpy(dtype=object)
+            values[pd.isna(values)] = None
+            rows = values.tolist()
+            generator.cur.executemany(insert_sql, rows)
+            generator.conn.commit()
+
+            imported += len(rows)
+            ranges.extend(id_ranges(row[key_position] for row in rows))
+            print(f"  ↳ {table}: {imported} rows imported")
+    finally:
+        generator.cur.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+    generator.bump_data_version(ranges)
+    elapsed = time.perf_counter() - started
+    print(f"✅ {table}: {imported} rows in {elapsed:.1f}s ({imported / max(elapsed, 1e-9):,.0f} rows/sec)")
+    return imported
+
+
+def _export_batches(conn, query, batch_size, columns=None):
+    # mysql.connector cursors are unbuffered by default: rows are read from
+    # the server as fetchmany() asks for them. A columns list passed in is
+    # filled with the result's column names once the query has run.
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query)
+        if columns is not None:
+            columns.extend(column[0] for column in cursor.description)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        cursor.close()
+
+
+def export_csv(conn, table, path, batch_size=50000):
+    """
+    Streams a table to CSV in the layout of the shipped exports. NULLs are
+    written as the NULL sentinel by MySQL itself (COALESCE), so each batch
+    goes straight to csv.writer without per-value Python work.
+    """
+    columns = TABLE_COLUMNS[table]
+    select = ', '.join(column if column == 'student_id' else f"COALESCE({column}, 'NULL')" for column in columns)
+    query = f"SELECT {select} FROM {table} ORDER BY student_id"
+
+    exported = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for rows in _export_batches(conn, query, batch_size):
+            writer.writerows(rows)
+            exported += len(rows)
+    return exported
+
+
+def export_parquet(conn, table, path, batch_size=50000):
+    """Streams a table to Parquet one row group per batch (requires pyarrow)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = TABLE_COLUMNS[table]
+    # Integer columns are INT in MySQL, so int32 holds any stored value
+    schema = pa.schema([
+        (column, pa.int32() if column in INT_COLUMNS
+         else pa.date32() if column == 'placement_date' else pa.string())
+        for column in columns
+    ])
+    query = f"SELECT {', '.join(columns)} FROM {table} ORDER BY student_id"
+
+    exported = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in _export_batches(conn, query, batch_size):
+            # Let Arrow infer, then cast: dates may arrive as date objects or text
+            arrays = [pa.array(values).cast(field.type) for values, field in zip(zip(*rows), schema)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            exported += len(rows)
+    return exported
+
+
+def export_insight(conn, name, path, batch_size=50000):
+    """
+    Streams the full result of one of the app's insights to CSV (the app
+    itself only pages through them), with NULLs written as the NULL sentinel.
+    """
+    columns, exported = [], 0
+    started = time.perf_counter()
+    batches = _export_batches(conn, INSIGHT_QUERIES[name], batch_size, columns)
+    first = next(batches, [])  # runs the query and fills columns
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for rows in itertools.chain([first], batches):
+            writer.writerows(['NULL' if value is None else value for value in row] for row in rows)
+            exported += len(rows)
+    elapsed = time.perf_counter() - started
+    print(f"✅ {name}: {exported} rows -> {path} in {elapsed:.1f}s ({exported / max(elapsed, 1e-9):,.0f} rows/sec)")
+    return exported
+
+
+def export_table(conn, table, data_dir, fmt='csv', batch_size=50000):
+    path = os.path.join(data_dir, f"{TABLE_FILES[table]}.{fmt}")
+    started = time.perf_counter()
+    export = export_parquet if fmt == 'parquet' else export_csv
+    exported = export(conn, table, path, batch_size)
+    elapsed = time.perf_counter() - started
+    print(f"✅ {table}: {exported} rows -> {path} in {elapsed:.1f}s ({exported / max(elapsed, 1e-9):,.0f} rows/sec)")
+    return exported
+
+
+# Main execution block
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream the placement tables between MySQL and CSV/Parquet files")
+    parser.add_argument('action', choices=['import', 'export'])
+    parser.add_argument('--dir', default='.', help="directory of the *_table files")
+    parser.add_argument('--tables', nargs='+', choices=TABLE_ORDER, default=TABLE_ORDER)
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv', help="export file format")
+    parser.add_argument('--chunk-size', type=int, default=100000, help="rows per import chunk/commit")
+    parser.add_argument('--batch-size', type=int, default=50000, help="rows fetched per export batch")
+    parser.add_argument('--insight', choices=list(INSIGHT_QUERIES),
+                        help="export this insight's full result to --output instead of the tables")
+    parser.add_argument('--output', default='insight.csv', help="CSV path for --insight")
+    args = parser.parse_args()
+
+    generator = PlacementDataGenerator(DB_CONFIG)
+    tables = [table for table in TABLE_ORDER if table in args.tables]
+    if args.action == 'import':
+        generator.create_tables()
+        for table in tables:
+            import_table(generator, table, os.path.join(args.dir, f"{TABLE_FILES[table]}.csv"), args.chunk_size)
+    elif args.insight:
+        export_insight(generator.conn, args.insight, args.output, args.batch_size)
+    else:
+        os.makedirs(args.dir, exist_ok=True)
+        for table in tables:
+            export_table(generator.conn, table, args.dir, args.format, args.batch_size)
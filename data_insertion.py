@@ -2,6 +2,14 @@
 import mysql.connector  # MySQL database connector for Python
 from faker import Faker  # Library to generate fake data
 import random  # To generate random values
+import argparse  # Command line options for the loader
+import multiprocessing  # Process pool for parallel data generation
+import csv  # Reading delta changesets
+from queries import CRITERIA_SQL, INSIGHT_QUERIES  # Queries checked by check_query_plans
+from queries import (  # Analytics rollups kept up to date by every load
+    CHANGED_STUDENTS_FILTER, ROLLUP_CELL_FILTER, batch_rollup_select_sql,
+    package_rollup_select_sql, rollup_merge_sql
+)
 
 # Initialize Faker with Indian locale for realistic data
 faker = Faker('en_IN')
@@ -14,24 +22,144 @@ DB_CONFIG = {
     'database': 'placement_db'
 }
 
+# Available course list
+COURSES = [
+    'Data Science', 'Full Stack Development', 'Automation & Testing',
+    'UI/UX', 'DevOps', 'Data Engineering', 'Business Analytics with Digital Marketing'
+]
+
+# Insert statements shared by the row-by-row and bulk loaders.
+# Child tables take student_id as their first value.
+STUDENT_INSERT_SQL = """
+    INSERT INTO students (name, age, gender, email, phone, enrollment_year, course_batch, city, graduation_year)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+STUDENT_BULK_INSERT_SQL = """
+    INSERT INTO students (student_id, name, age, gender, email, phone, enrollment_year, course_batch, city, graduation_year)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+PROGRAMMING_INSERT_SQL = """
+    INSERT INTO programming (student_id, programming_id, language, problems_solved, assessments_completed,
+        mini_projects, certifications_earned, latest_project_score)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+SOFT_SKILLS_INSERT_SQL = """
+    INSERT INTO soft_skills (student_id, soft_skill_id, communication, teamwork, presentation,
+        leadership, critical_thinking, interpersonal_skills)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+PLACEMENT_INSERT_SQL = """
+    INSERT INTO placements (student_id, placement_id, mock_interview_score, internships_completed,
+        placement_status, company_name, placement_package, interview_rounds_cleared, placement_date)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# Column layout of each table as exported to *_table.csv (generated
+# columns excluded), and the key columns a changeset must not overwrite
+TABLE_COLUMNS = {
+    'students': ['student_id', 'name', 'age', 'gender', 'email', 'phone',
+                 'enrollment_year', 'course_batch', 'city', 'graduation_year'],
+    'programming': ['programming_id', 'student_id', 'language', 'problems_solved', 'assessments_completed',
+                    'mini_projects', 'certifications_earned', 'latest_project_score'],
+    'soft_skills': ['soft_skill_id', 'student_id', 'communication', 'teamwork', 'presentation',
+                    'leadership', 'critical_thinking', 'interpersonal_skills'],
+    'placements': ['placement_id', 'student_id', 'mock_interview_score', 'internships_completed',
+                   'placement_status', 'company_name', 'placement_package',
+                   'interview_rounds_cleared', 'placement_date']
+}
+TABLE_KEYS = {
+    'students': ['student_id'],
+    'programming': ['programming_id', 'student_id'],
+    'soft_skills': ['soft_skill_id', 'student_id'],
+    'placements': ['placement_id', 'student_id']
+}
+
+# Columns added to tables created by older versions of this script:
+# (table, column, definition)
+SCHEMA_COLUMNS = [
+    ('soft_skills', 'soft_skill_avg',
+     "DECIMAL(5,2) AS (ROUND((communication + teamwork + presentation + leadership + "
+     "critical_thinking + interpersonal_skills) / 6.0, 2)) STORED"),
+    # Numeric package parsed from the '12.34 LPA' text, so it sorts and
+    # range-filters numerically; being generated, existing rows are backfilled
+    ('placements', 'package_lpa',
+     "DECIMAL(6,2) AS (CAST(NULLIF(TRIM(REPLACE(placement_package, 'LPA', '')), '') AS DECIMAL(6,2))) STORED"),
+]
+
+# Secondary indexes: (table, index name, definition).
+# Each student has exactly one programming, soft_skills and placements row,
+# so the student_id lookups are unique keys.
+SCHEMA_INDEXES = [
+    ('students', 'idx_students_course_batch', "INDEX (course_batch)"),
+    ('programming', 'uq_programming_student', "UNIQUE (student_id)"),
+    ('programming', 'idx_programming_problems', "INDEX (problems_solved, mini_projects)"),
+    ('soft_skills', 'uq_soft_skills_student', "UNIQUE (student_id)"),
+    ('soft_skills', 'idx_soft_skill_avg', "INDEX (soft_skill_avg)"),
+    ('placements', 'uq_placements_student', "UNIQUE (student_id)"),
+    ('placements', 'idx_placements_status', "INDEX (placement_status)"),
+    ('placements', 'idx_placements_status_package', "INDEX (placement_status, package_lpa)"),
+]
+
+# Pre-aggregated analytics tables (see refresh_rollups): (table, definition).
+# Keys are NOT NULL because they form the primary key; missing values are '' / 0
+ROLLUP_TABLES = [
+    ('batch_rollup', """(
+        course_batch VARCHAR(100) NOT NULL,
+        enrollment_year INT NOT NULL,
+        placement_status VARCHAR(20) NOT NULL,
+        students INT NOT NULL,
+        problems_count INT NOT NULL,
+        problems_sum BIGINT NOT NULL,
+        problems_min INT,
+        problems_max INT,
+        soft_skill_count INT NOT NULL,
+        soft_skill_sum DECIMAL(14,2) NOT NULL,
+        PRIMARY KEY (course_batch, enrollment_year, placement_status)
+    )"""),
+    ('package_rollup', """(
+        course_batch VARCHAR(100) NOT NULL,
+        enrollment_year INT NOT NULL,
+        placement_status VARCHAR(20) NOT NULL,
+        package_tenths INT NOT NULL,
+        students INT NOT NULL,
+        PRIMARY KEY (course_batch, enrollment_year, placement_status, package_tenths)
+    )"""),
+]
+
 class PlacementDataGenerator:
     """
     Class responsible for generating and inserting synthetic student placement-related data 
     into a MySQL database, including programming skills, soft skills, and placement details.
     """
 
-    def __init__(self, db_config):
-        # Establish connection to MySQL database
-        self.conn = mysql.connector.connect(**db_config)
-        self.cur = self.conn.cursor()
+    def __init__(self, db_config, seed=None, id_offset=0):
+        # Establish connection to MySQL database (generation-only instances,
+        # such as the parallel workers, pass db_config=None)
+        self.conn = mysql.connector.connect(**db_config) if db_config else None
+        self.cur = self.conn.cursor() if self.conn else None
+
+        # Use the pre-initialized Faker object and the global random state,
+        # or private seeded ones when reproducible output is requested
+        if seed is None:
+            self.faker = faker
+            self.random = random
+        else:
+            self.faker = Faker('en_IN')
+            self.faker.seed_instance(seed)
+            self.random = random.Random(seed)
 
-        # Use the pre-initialized Faker object
-        self.faker = faker
+        self.set_id_counters(id_offset)
 
-        # Counters to generate unique IDs
-        self.placement_counter = 4001
-        self.programming_counter = 4001
-        self.soft_skill_counter = 4001
+    def set_id_counters(self, id_offset):
+        """
+        Restarts the counters behind the custom IDs at 4001 + id_offset. Loads
+        pass the student_id they start from minus one, so a load into a
+        non-empty database (or one shard of it) continues past the IDs
+        already used instead of repeating them.
+        """
+        self.placement_counter = 4001 + id_offset
+        self.programming_counter = 4001 + id_offset
+        self.soft_skill_counter = 4001 + id_offset
 
     def create_tables(self):
         """
@@ -114,6 +242,158 @@ class PlacementDataGenerator:
         # Commit table creation
         self.conn.commit()
 
+        # Bookkeeping tables, generated columns, indexes and rollup tables are shared with the migration path
+        self.migrate_schema()
+
+    def migrate_schema(self):
+        """
+        Brings an existing database up to the current schema by adding any
+        missing data version tables, generated columns, secondary indexes and
+        rollup tables (built from the existing data). Safe to run repeatedly.
+        """
+        # Single-row table holding the data version; the app drops its
+        # cached query results whenever a load bumps it
+        self.cur.execute("""
+            CREATE TABLE IF NOT EXISTS data_version (
+                id TINYINT PRIMARY KEY,
+                version BIGINT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Student id ranges touched by each data version, so the app can
+        # refresh only those students in its resident student store
+        self.cur.execute("""
+            CREATE TABLE IF NOT EXISTS data_changes (
+                version BIGINT NOT NULL,
+                first_student_id INT NOT NULL,
+                last_student_id INT NOT NULL,
+                INDEX (version)
+            )
+        """)
+
+        self.cur.execute("""
+            SELECT table_name, column_name FROM information_schema.columns
+            WHERE table_schema = DATABASE()
+        """)
+        existing_columns = {(table.lower(), column.lower()) for table, column in self.cur.fetchall()}
+
+        for table, column, definition in SCHEMA_COLUMNS:
+            if (table, column) not in existing_columns:
+                print(f"  ↳ adding {table}.{column}")
+                self.cur.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+        self.cur.execute("""
+            SELECT DISTINCT table_name, index_name FROM information_schema.statistics
+            WHERE table_schema = DATABASE()
+        """)
+        existing_indexes = {(table.lower(), index.lower()) for table, index in self.cur.fetchall()}
+
+        for table, name, definition in SCHEMA_INDEXES:
+            if (table, name) not in existing_indexes:
+                print(f"  ↳ adding index {table}.{name}")
+                kind, columns = definition.split(' ', 1)
+                self.cur.execute(f"ALTER TABLE {table} ADD {kind} {name} {columns}")
+
+        self.cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = DATABASE()")
+        existing_tables = {table.lower() for (table,) in self.cur.fetchall()}
+
+        missing_rollups = [(table, definition) for table, definition in ROLLUP_TABLES if table not in existing_tables]
+        for table, definition in missing_rollups:
+            print(f"  ↳ adding table {table}")
+            self.cur.execute(f"CREATE TABLE {table} {definition}")
+
+        self.conn.commit()
+        if missing_rollups:
+            self.rebuild_rollups()
+
+    def check_query_plans(self):
+        """
+        Runs EXPLAIN on the criteria filter for every course and on the top
+        package insight and prints the plans. Returns False if MySQL would
+        full-scan any table (type ALL) or filesort the top package list.
+        """
+        cur = self.conn.cursor(dictionary=True)
+        ok = True
+        for course in COURSES:
+            # The app's defaults and the recommended placement thresholds
+            for params in ((course, 150, 5, 60), (course, 250, 8, 70)):
+                cur.execute("EXPLAIN " + CRITERIA_SQL, params)
+                for row in cur.fetchall():
+                    full_scan = row['type'] == 'ALL'
+                    ok = ok and not full_scan
+                    print(f"{'❌' if full_scan else '✅'} {params}: {row['table']} "
+                          f"type={row['type']} key={row['key']} rows={row['rows']}")
+
+        cur.execute("EXPLAIN " + INSIGHT_QUERIES["Top 10 students with highest package"])
+        for row in cur.fetchall():
+            bad_plan = row['type'] == 'ALL' or 'filesort' in (row['Extra'] or '')
+            ok = ok and not bad_plan
+            print(f"{'❌' if bad_plan else '✅'} top package: {row['table']} "
+                  f"type={row['type']} key={row['key']} extra={row['Extra']}")
+        cur.close()
+        return ok
+
+    def bump_data_version(self, changed_ranges=(), new_students=False, stale_cells=()):
+        """
+        Marks a completed data load by incrementing the data version,
+        which invalidates the dashboard's query result cache, records
+        the (first, last) student_id ranges the load touched and refreshes
+        the rollup tables in the same transaction (see refresh_rollups).
+        """
+        self.cur.execute("""
+            INSERT INTO data_version (id, version) VALUES (1, 1)
+            ON DUPLICATE KEY UPDATE version = version + 1
+        """)
+        self.cur.execute("SELECT version FROM data_version WHERE id = 1")
+        version = self.cur.fetchone()[0]
+        # A version without changed students still gets an (empty) entry, so
+        # the app can tell a complete change log from a gap and need not rebuild
+        self.cur.executemany(
+            "INSERT INTO data_changes (version, first_student_id, last_student_id) VALUES (%s, %s, %s)",
+            [(version, first, last) for first, last in changed_ranges or [(1, 0)]]
+        )
+        self.refresh_rollups(version, new_students, stale_cells)
+        self.conn.commit()
+
+    def refresh_rollups(self, version, new_students=False, stale_cells=()):
+        """
+        Updates batch_rollup and package_rollup for the students recorded in
+        data_changes for version. Students inserted by the load together with
+        all their rows (new_students) are merged into the existing groups.
+        Otherwise every (course_batch, enrollment_year) cell they are in, or
+        were in before the load (stale_cells), is recomputed from the base
+        tables. Does not commit.
+        """
+        rollups = (('batch_rollup', batch_rollup_select_sql), ('package_rollup', package_rollup_select_sql))
+        if new_students:
+            for table, select_sql in rollups:
+                self.cur.execute(rollup_merge_sql(table, select_sql(CHANGED_STUDENTS_FILTER)), (version,))
+            return
+
+        self.cur.execute(f"""
+            SELECT DISTINCT COALESCE(s.course_batch, ''), COALESCE(s.enrollment_year, 0)
+            FROM students s {CHANGED_STUDENTS_FILTER}
+        """, (version,))
+        cells = set(stale_cells) | set(self.cur.fetchall())
+        for cell in cells:
+            for table, select_sql in rollups:
+                self.cur.execute(f"DELETE FROM {table} WHERE course_batch = %s AND enrollment_year = %s", cell)
+                self.cur.execute(rollup_merge_sql(table, select_sql(ROLLUP_CELL_FILTER)), cell)
+
+    def rebuild_rollups(self):
+        """
+        Recomputes both rollup tables from the base tables and bumps the data
+        version (no students changed) so the app drops results cached from
+        the old rollups.
+        """
+        for table, select_sql in (('batch_rollup', batch_rollup_select_sql),
+                                  ('package_rollup', package_rollup_select_sql)):
+            self.cur.execute(f"DELETE FROM {table}")
+            self.cur.execute(rollup_merge_sql(table, select_sql()))
+        self.bump_data_version()
+        print("✅ Rebuilt the rollup tables.")
+
     def get_languages_for_course(self, course):
         """
         Returns a string of randomly selected programming languages/tools 
@@ -130,7 +410,7 @@ class PlacementDataGenerator:
         }
 
         # Randomly sample 1 to all tools/languages for a course
-        return ', '.join(random.sample(mapping[course], k=random.randint(1, len(mapping[course]))))
+        return ', '.join(self.random.sample(mapping[course], k=self.random.randint(1, len(mapping[course]))))
 
     def generate_ids(self, name, enrollment_year):
         """
@@ -153,110 +433,376 @@ class PlacementDataGenerator:
 
         return placement_id, programming_id, soft_skill_id
 
+    def generate_student(self):
+        """
+        Generates one synthetic student record and returns the rows for the
+        students, programming, soft_skills and placements tables. The student
+        row excludes student_id and the other rows exclude their student_id
+        column, so callers can attach either an AUTO_INCREMENT or a reserved id.
+        """
+        # Generate student profile
+        name = self.faker.name()
+        age = self.random.randint(20, 35)
+        gender = self.random.choice(['Male', 'Female'])
+        email = self.faker.email()
+        phone = self.faker.phone_number()
+        enrollment_year = self.random.randint(2022, 2025)
+        course_batch = self.random.choice(COURSES)
+        city = self.faker.city()
+        graduation_year = enrollment_year
+
+        # Generate IDs and programming languages based on course
+        placement_id, programming_id, soft_skill_id = self.generate_ids(name, enrollment_year)
+        language = self.get_languages_for_course(course_batch)
+
+        # Decide placement status and generate attributes accordingly
+        rand_val = self.random.random()
+        if rand_val < 0.15:  # ~15% get placed
+            placement_status = 'Placed'
+            problems_solved = self.random.randint(250, 600)
+            mock_score = self.random.randint(70, 100)
+            soft_skills = [self.random.randint(70, 100) for _ in range(6)]
+            company_name = self.faker.company()
+            placement_package = f"{round(self.random.uniform(3.5, 15), 2)} LPA"
+            interview_rounds = self.random.randint(3, 5)
+            placement_date = self.faker.date_this_decade()
+            internships = self.random.randint(1, 3)
+        elif rand_val < 0.53:  # ~38% are ready
+            placement_status = 'Ready'
+            problems_solved = self.random.randint(250, 600)
+            mock_score = self.random.randint(70, 85)
+            soft_skills = [self.random.randint(70, 100) for _ in range(6)]
+            company_name = None
+            placement_package = None
+            interview_rounds = None
+            placement_date = None
+            internships = self.random.randint(0, 2)
+        else:  # remaining students are Not Ready
+            placement_status = 'Not Ready'
+            problems_solved = self.random.randint(50, 249)
+            mock_score = self.random.randint(50, 69)
+            soft_skills = [self.random.randint(50, 69) for _ in range(6)]
+            company_name = None
+            placement_package = None
+            interview_rounds = None
+            placement_date = None
+            internships = self.random.randint(0, 1)
+
+        mini_projects = self.random.randint(8, 10) if placement_status in ['Placed', 'Ready'] else self.random.randint(5, 7)
+
+        student = (name, age, gender, email, phone, enrollment_year, course_batch, city, graduation_year)
+        programming = (
+            programming_id, language, problems_solved,
+            self.random.randint(0, 10), mini_projects,
+            self.random.randint(0, 5), self.random.randint(60, 100)
+        )
+        soft_skill = (soft_skill_id, *soft_skills)
+        placement = (
+            placement_id, mock_score, internships,
+            placement_status, company_name, placement_package,
+            interview_rounds, placement_date
+        )
+        return student, programming, soft_skill, placement
+
     def populate_data(self, total_students=1000):
         """
         Populates the database with randomly generated synthetic data 
         for the given number of students.
         """
-        # Available course list
-        courses = [
-            'Data Science', 'Full Stack Development', 'Automation & Testing',
-            'UI/UX', 'DevOps', 'Data Engineering', 'Business Analytics with Digital Marketing'
-        ]
-
+        first_student_id = None
+        self.set_id_counters(self.reserve_student_ids() - 1)
         for _ in range(total_students):
-            # Generate student profile
-            name = self.faker.name()
-            age = random.randint(20, 35)
-            gender = random.choice(['Male', 'Female'])
-            email = self.faker.email()
-            phone = self.faker.phone_number()
-            enrollment_year = random.randint(2022, 2025)
-            course_batch = random.choice(courses)
-            city = self.faker.city()
-            graduation_year = enrollment_year
+            student, programming, soft_skill, placement = self.generate_student()
 
             # Insert student into students table
-            self.cur.execute("""
-                INSERT INTO students (name, age, gender, email, phone, enrollment_year, course_batch, city, graduation_year)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (name, age, gender, email, phone, enrollment_year, course_batch, city, graduation_year))
+            self.cur.execute(STUDENT_INSERT_SQL, student)
             student_id = self.cur.lastrowid
+            if first_student_id is None:
+                first_student_id = student_id
 
-            # Generate IDs and programming languages based on course
-            placement_id, programming_id, soft_skill_id = self.generate_ids(name, enrollment_year)
-            language = self.get_languages_for_course(course_batch)
-
-            # Decide placement status and generate attributes accordingly
-            rand_val = random.random()
-            if rand_val < 0.15:  # ~15% get placed
-                placement_status = 'Placed'
-                problems_solved = random.randint(250, 600)
-                mock_score = random.randint(70, 100)
-                soft_skills = [random.randint(70, 100) for _ in range(6)]
-                company_name = self.faker.company()
-                placement_package = f"{round(random.uniform(3.5, 15), 2)} LPA"
-                interview_rounds = random.randint(3, 5)
-                placement_date = self.faker.date_this_decade()
-                internships = random.randint(1, 3)
-            elif rand_val < 0.53:  # ~38% are ready
-                placement_status = 'Ready'
-                problems_solved = random.randint(250, 600)
-                mock_score = random.randint(70, 85)
-                soft_skills = [random.randint(70, 100) for _ in range(6)]
-                company_name = None
-                placement_package = None
-                interview_rounds = None
-                placement_date = None
-                internships = random.randint(0, 2)
-            else:  # remaining students are Not Ready
-                placement_status = 'Not Ready'
-                problems_solved = random.randint(50, 249)
-                mock_score = random.randint(50, 69)
-                soft_skills = [random.randint(50, 69) for _ in range(6)]
-                company_name = None
-                placement_package = None
-                interview_rounds = None
-                placement_date = None
-                internships = random.randint(0, 1)
-
-            # Insert into programming table
-            mini_projects = random.randint(8, 10) if placement_status in ['Placed', 'Ready'] else random.randint(5, 7)
-            self.cur.execute("""
-                INSERT INTO programming (programming_id, student_id, language, problems_solved, assessments_completed,
-                    mini_projects, certifications_earned, latest_project_score)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                programming_id, student_id, language, problems_solved,
-                random.randint(0, 10), mini_projects,
-                random.randint(0, 5), random.randint(60, 100)
-            ))
-
-            # Insert into soft_skills table
-            self.cur.execute("""
-                INSERT INTO soft_skills (soft_skill_id, student_id, communication, teamwork, presentation,
-                    leadership, critical_thinking, interpersonal_skills)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """, (soft_skill_id, student_id, *soft_skills))
-
-            # Insert into placements table
-            self.cur.execute("""
-                INSERT INTO placements (placement_id, student_id, mock_interview_score, internships_completed,
-                    placement_status, company_name, placement_package, interview_rounds_cleared, placement_date)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                placement_id, student_id, mock_score, internships,
-                placement_status, company_name, placement_package,
-                interview_rounds, placement_date
-            ))
+            # Insert into programming, soft_skills and placements tables
+            self.cur.execute(PROGRAMMING_INSERT_SQL, (student_id, *programming))
+            self.cur.execute(SOFT_SKILLS_INSERT_SQL, (student_id, *soft_skill))
+            self.cur.execute(PLACEMENT_INSERT_SQL, (student_id, *placement))
 
         # Final commit to save all inserted records
         self.conn.commit()
+        self.bump_data_version([(first_student_id, student_id)] if total_students else [], new_students=True)
         print(f"✅ Successfully inserted {total_students} student records.")
 
+    def reserve_student_ids(self):
+        """
+        Returns the first free student_id so bulk loads can assign ids
+        up front instead of reading cur.lastrowid after every insert, and
+        every load can continue the custom ID counters from it.
+        Assumes a single loader is writing to the database at a time.
+        """
+        self.cur.execute("SELECT COALESCE(MAX(student_id), 0) FROM students")
+        return self.cur.fetchone()[0] + 1
+
+    def write_batch(self, students, programming, soft_skills, placements):
+        """
+        Writes one chunk of generated rows with multi-row executemany
+        inserts (parents first) and commits the chunk.
+        """
+        self.cur.executemany(STUDENT_BULK_INSERT_SQL, students)
+        self.cur.executemany(PROGRAMMING_INSERT_SQL, programming)
+        self.cur.executemany(SOFT_SKILLS_INSERT_SQL, soft_skills)
+        self.cur.executemany(PLACEMENT_INSERT_SQL, placements)
+        self.conn.commit()
+
+    def populate_data_bulk(self, total_students=1000, batch_size=5000):
+        """
+        Bulk-load variant of populate_data. Rows are generated in chunks of
+        batch_size students, written with one executemany per table and
+        committed per chunk, so large loads avoid per-row round trips and a
+        single huge transaction.
+        """
+        first_student_id = next_student_id = self.reserve_student_ids()
+        self.set_id_counters(first_student_id - 1)
+
+        # Rows are inserted parent-first within each chunk, so FK checks add
+        # nothing but per-row lookups during the load
+        self.cur.execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            inserted = 0
+            while inserted < total_students:
+                chunk = min(batch_size, total_students - inserted)
+                students, programming, soft_skills, placements = [], [], [], []
+
+                for _ in range(chunk):
+                    student, prog, soft_skill, placement = self.generate_student()
+                    students.append((next_student_id, *student))
+                    programming.append((next_student_id, *prog))
+                    soft_skills.append((next_student_id, *soft_skill))
+                    placements.append((next_student_id, *placement))
+                    next_student_id += 1
+
+                self.write_batch(students, programming, soft_skills, placements)
+                inserted += chunk
+                print(f"  ↳ {inserted}/{total_students} students written")
+        finally:
+            self.cur.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+        self.bump_data_version([(first_student_id, next_student_id - 1)] if total_students else [],
+                               new_students=True)
+        print(f"✅ Successfully bulk-inserted {total_students} student records.")
+
+    def populate_data_parallel(self, total_students=1000, batch_size=5000, workers=None, seed=0):
+        """
+        Parallel variant of populate_data_bulk. total_students is split into
+        shards of batch_size; each shard is generated in a worker process with
+        its own seed and a pre-partitioned slice of the ID counters and
+        student_ids, and this process acts as the single writer.
+        Output depends only on seed and batch_size, not on the worker count.
+        """
+        first_student_id = self.reserve_student_ids()
+        shards = [
+            (seed, offset, min(batch_size, total_students - offset), first_student_id)
+            for offset in range(0, total_students, batch_size)
+        ]
+
+        self.cur.execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            inserted = 0
+            with multiprocessing.Pool(processes=workers) as pool:
+                # imap keeps shard order and streams results as they complete
+                for rows in pool.imap(generate_shard, shards):
+                    self.write_batch(*rows)
+                    inserted += len(rows[0])
+                    print(f"  ↳ {inserted}/{total_students} students written")
+        finally:
+            self.cur.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+        self.bump_data_version([(first_student_id, first_student_id + total_students - 1)] if total_students else [],
+                               new_students=True)
+        print(f"✅ Successfully inserted {total_students} student records using parallel generation.")
+
+
+    def apply_changeset(self, table, csv_path, batch_size=5000):
+        """
+        Delta-loads a CSV in the same layout as the table's *_table.csv export
+        with batched INSERT ... ON DUPLICATE KEY UPDATE, keyed on student_id.
+        Rows identical to the stored ones are not written or logged, and a
+        student_id listed more than once in a batch keeps its last row.
+        Rows whose table id (programming_id, ...) belongs to another student,
+        or differs from the one stored for their student, are rejected: the
+        upsert would update the wrong row or could not change the key.
+        Returns how many rows were inserted, updated, left unchanged and rejected.
+        """
+        if table not in TABLE_COLUMNS:
+            raise ValueError(f"Unknown table {table!r}; expected one of {', '.join(TABLE_COLUMNS)}")
+        columns = TABLE_COLUMNS[table]
+        updates = ', '.join(f"{column} = VALUES({column})" for column in columns if column not in TABLE_KEYS[table])
+        upsert_sql = f"""
+            INSERT INTO {table} ({', '.join(columns)})
+            VALUES ({', '.join(['%s'] * len(columns))})
+            ON DUPLICATE KEY UPDATE {updates}
+        """
+        key_position = columns.index('student_id')
+
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'rejected': 0}
+        student_ids, stale_cells = [], set()
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            missing = set(columns) - set(reader.fieldnames or [])
+            if missing:
+                raise ValueError(f"{csv_path} is missing columns for {table}: {', '.join(sorted(missing))}")
+
+            batch = {}  # student_id -> row
+            for record in reader:
+                # The exports write missing values as NULL
+                row = tuple(None if record[column] in ('NULL', '') else record[column] for column in columns)
+                try:
+                    student_id = int(row[key_position])
+                except (TypeError, ValueError):
+                    raise ValueError(f"{csv_path} line {reader.line_num}: student_id must be an integer, "
+                                     f"got {record['student_id']!r}") from None
+                batch.pop(student_id, None)  # a repeated student keeps its last row
+                batch[student_id] = row
+                if len(batch) == batch_size:
+                    self._upsert_batch(table, upsert_sql, batch, key_position, counts, student_ids, stale_cells)
+                    batch = {}
+            if batch:
+                self._upsert_batch(table, upsert_sql, batch, key_position, counts, student_ids, stale_cells)
+
+        if student_ids:
+            self.bump_data_version(id_ranges(student_ids), stale_cells=stale_cells)
+        print(f"✅ {table}: {counts['inserted']} inserted, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged, {counts['rejected']} rejected")
+        return counts
+
+    def _upsert_batch(self, table, upsert_sql, batch, key_position, counts, student_ids, stale_cells):
+        columns = TABLE_COLUMNS[table]
+        ids = list(batch)
+        placeholders = ', '.join(['%s'] * len(ids))
+        # The child tables' own primary key (programming_id, ...) is a second unique key
+        table_key = next((key for key in TABLE_KEYS[table] if key != 'student_id'), None)
+        if table_key is None:
+            self.cur.execute(f"SELECT {', '.join(columns)} FROM {table} WHERE student_id IN ({placeholders})", ids)
+        else:
+            table_ids = [row[columns.index(table_key)] for row in batch.values()]
+            self.cur.execute(f"""
+                SELECT {', '.join(columns)} FROM {table}
+                WHERE student_id IN ({placeholders}) OR {table_key} IN ({placeholders})
+            """, ids + table_ids)
+        rows = self.cur.fetchall()
+        stored = {row[key_position]: row for row in rows}
+
+        if table_key is not None:
+            # ON DUPLICATE KEY UPDATE fires on whichever unique key collides, so a
+            # table id owned by another student (stored or earlier in this batch)
+            # would update that student's row; a changed table id is never applied
+            id_position = columns.index(table_key)
+            owners = {row[id_position]: row[key_position] for row in rows}
+            rejected = []
+            for student_id, row in batch.items():
+                if owners.setdefault(row[id_position], student_id) != student_id or (
+                        student_id in stored and stored[student_id][id_position] != row[id_position]):
+                    rejected.append(student_id)
+            if rejected:
+                print(f"⚠️ {table}: skipped {len(rejected)} row(s) whose {table_key} belongs to another student "
+                      f"or differs from the stored one (student_id {', '.join(map(str, rejected[:10]))}"
+                      f"{', ...' if len(rejected) > 10 else ''})")
+                rejected = set(rejected)
+                batch = {student_id: row for student_id, row in batch.items() if student_id not in rejected}
+                counts['rejected'] += len(rejected)
+
+        # Compared as text, as the exports write values; a value spelled
+        # differently (e.g. 07 for 7) only costs a redundant update
+        changed = [student_id for student_id, row in batch.items()
+                   if student_id not in stored
+                   or tuple(None if value is None else str(value) for value in stored[student_id]) != row]
+        if changed:
+            self.cur.executemany(upsert_sql, [batch[student_id] for student_id in changed])
+            self.conn.commit()
+        if table == 'students':
+            # Updated students may move to another rollup cell; remember where they were
+            course, year = columns.index('course_batch'), columns.index('enrollment_year')
+            stale_cells.update((stored[student_id][course] or '', stored[student_id][year] or 0)
+                               for student_id in changed if student_id in stored)
+
+        inserted = sum(student_id not in stored for student_id in changed)
+        counts['inserted'] += inserted
+        counts['updated'] += len(changed) - inserted
+        counts['unchanged'] += len(batch) - len(changed)
+        student_ids.extend(changed)
+
+
+def id_ranges(student_ids):
+    """Collapses student_ids into sorted (first, last) runs of consecutive ids."""
+    ranges = []
+    for student_id in sorted(set(student_ids)):
+        if ranges and student_id == ranges[-1][1] + 1:
+            ranges[-1][1] = student_id
+        else:
+            ranges.append([student_id, student_id])
+    return [tuple(run) for run in ranges]
+
+
+def generate_shard(shard):
+    """
+    Worker entry point for populate_data_parallel. Generates the rows for one
+    shard (base seed, offset, size, first student_id) and returns them as the
+    students, programming, soft_skills and placements lists for write_batch.
+    """
+    base_seed, offset, size, first_student_id = shard
+
+    # Derive a distinct but reproducible seed for each shard
+    generator = PlacementDataGenerator(None, seed=base_seed * 1_000_003 + offset,
+                                       id_offset=first_student_id - 1 + offset)
+
+    students, programming, soft_skills, placements = [], [], [], []
+    student_id = first_student_id + offset
+    for _ in range(size):
+        student, prog, soft_skill, placement = generator.generate_student()
+        students.append((student_id, *student))
+        programming.append((student_id, *prog))
+        soft_skills.append((student_id, *soft_skill))
+        placements.append((student_id, *placement))
+        student_id += 1
+
+    return students, programming, soft_skills, placements
+
 # Main execution block
 if __name__ == "__main__":
-    # Instantiate data generator and run table creation and data population
+    parser = argparse.ArgumentParser(description="Generate synthetic placement data into MySQL")
+    parser.add_argument('--students', type=int, default=1000, help="number of students to generate")
+    parser.add_argument('--bulk', action='store_true', help="use batched executemany inserts")
+    parser.add_argument('--batch-size', type=int, default=5000, help="students per bulk chunk/commit")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="generate in parallel with this many processes (implies --bulk)")
+    parser.add_argument('--seed', type=int, default=0, help="base seed for parallel generation")
+    parser.add_argument('--migrate', action='store_true', help="only upgrade the schema of an existing database")
+    parser.add_argument('--explain', action='store_true',
+                        help="only EXPLAIN the criteria filter and fail if it full-scans a table")
+    parser.add_argument('--rebuild-rollups', action='store_true',
+                        help="only recompute the analytics rollup tables from the base tables")
+    parser.add_argument('--delta', nargs=2, action='append', metavar=('TABLE', 'CSV'),
+                        help="only upsert a changeset CSV into TABLE (repeatable)")
+    args = parser.parse_args()
+
+    # Instantiate data generator
     generator = PlacementDataGenerator(DB_CONFIG)
+    if args.migrate:
+        generator.migrate_schema()
+        raise SystemExit(0)
+    if args.explain:
+        raise SystemExit(0 if generator.check_query_plans() else 1)
+    if args.rebuild_rollups:
+        generator.rebuild_rollups()
+        raise SystemExit(0)
+    if args.delta:
+        for table, csv_path in args.delta:
+            generator.apply_changeset(table, csv_path, batch_size=args.batch_size)
+        raise SystemExit(0)
+
+    # Run table creation and data population
     generator.create_tables()
-    generator.populate_data(total_students=1000)
+    if args.workers:
+        generator.populate_data_parallel(total_students=args.students, batch_size=args.batch_size,
+                                         workers=args.workers, seed=args.seed)
+    elif args.bulk:
+        generator.populate_data_bulk(total_students=args.students, batch_size=args.batch_size)
+    else:
+        generator.populate_data(total_students=args.students)
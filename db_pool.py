@@ -0,0 +1,173 @@
+#db_pool.py
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of database connections shared by every Streamlit
+    session in the process. Connections are created lazily up to max_size,
+    pinged before reuse when they have been idle for a while, and closed once
+    they sit idle longer than idle_timeout.
+    """
+
+    def __init__(self, factory, max_size=10, idle_timeout=300, health_check_after=30, wait_timeout=10):
+        self.factory = factory  # callable returning a new DB-API connection
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.wait_timeout = wait_timeout
+
+        self._idle = deque()  # (connection, released_at), most recent on the right
+        self._open = 0
+        self._lock = threading.Condition()
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'wait_seconds': 0.0,
+            'created': 0,
+            'evicted_idle': 0,
+            'failed_health_checks': 0,
+            'discarded': 0
+        }
+
+    def acquire(self):
+        """
+        Borrows a connection, waiting up to wait_timeout seconds when all
+        max_size connections are checked out. Raises TimeoutError if none
+        becomes free in time.
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            stale = []
+            try:
+                conn, released_at = self._checkout(deadline, stale)
+            finally:
+                # Closing and pinging run outside the lock, so a slow or dead
+                # server does not hold up every other checkout and release
+                self._close_quietly(stale)
+            if conn is None or time.monotonic() - released_at < self.health_check_after or self._is_alive(conn):
+                break
+            with self._lock:
+                self._stats['failed_health_checks'] += 1
+                self._forget(1)
+            self._close_quietly([conn])
+
+        created = conn is None
+        if created:
+            try:
+                conn = self.factory()
+            except Exception:
+                with self._lock:
+                    self._forget(1)
+                raise
+        with self._lock:
+            self._stats['checkouts'] += 1
+            self._stats['created'] += created
+        return conn
+
+    def release(self, conn, discard=False):
+        """
+        Returns a borrowed connection. Pass discard=True when the connection
+        hit an error and should be closed instead of reused.
+        """
+        with self._lock:
+            if discard:
+                self._stats['discarded'] += 1
+                self._forget(1)
+            else:
+                self._idle.append((conn, time.monotonic()))
+                self._lock.notify()
+        if discard:
+            self._close_quietly([conn])
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            self.release(conn, discard=True)
+            raise
+        else:
+            self.release(conn)
+
+    def metrics(self):
+        with self._lock:
+            metrics = dict(self._stats)
+            metrics['open'] = self._open
+            metrics['idle'] = len(self._idle)
+            metrics['in_use'] = self._open - len(self._idle)
+            metrics['max_size'] = self.max_size
+        return metrics
+
+    def close_all(self):
+        with self._lock:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._forget(len(idle))
+        self._close_quietly(idle)
+
+    def _checkout(self, deadline, stale):
+        """
+        Pops the most recently released idle connection as (conn, released_at),
+        or reserves a slot for a new one and returns (None, None), waiting
+        while the pool is full. Evicted connections are added to stale.
+        """
+        waited = False
+        with self._lock:
+            while True:
+                stale.extend(self._evict_idle())
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self.max_size:
+                    # Reserve the slot before connecting outside the lock
+                    self._open += 1
+                    return None, None
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No database connection free after {self.wait_timeout}s")
+                if not waited:
+                    self._stats['waits'] += 1
+                    waited = True
+                started = time.monotonic()
+                self._lock.wait(remaining)
+                self._stats['wait_seconds'] += time.monotonic() - started
+
+    # Helpers below expect self._lock to be held
+    def _evict_idle(self):
+        """Takes the connections idle longer than idle_timeout out of the pool and returns them for closing."""
+        now = time.monotonic()
+        evicted = []
+        # Oldest idle connections are on the left
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            self._stats['evicted_idle'] += 1
+            evicted.append(self._idle.popleft()[0])
+        self._forget(len(evicted))
+        return evicted
+
+    def _forget(self, count):
+        # Frees the slots of connections leaving the pool; callers close them after releasing the lock
+        if count:
+            self._open -= count
+            self._lock.notify(count)
+
+    # Helpers below run without the lock
+    @staticmethod
+    def _close_quietly(connections):
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _is_alive(conn):
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,133 @@
+#frames.py
+import numpy as np
+import pandas as pd
+
+# Compact dtypes for the columns the app reads. Scores are 0-100 and the
+# counters are small, so int8/int16 hold them; repeated labels become
+# categoricals. Columns not listed stay as Python objects.
+INT_COLUMNS = {
+    'student_id': 'int32',
+    'age': 'int8',
+    'enrollment_year': 'int16',
+    'graduation_year': 'int16',
+    'problems_solved': 'int16',
+    'assessments_completed': 'int8',
+    'mini_projects': 'int8',
+    'certifications_earned': 'int8',
+    'latest_project_score': 'int8',
+    'communication': 'int8',
+    'teamwork': 'int8',
+    'presentation': 'int8',
+    'leadership': 'int8',
+    'critical_thinking': 'int8',
+    'interpersonal_skills': 'int8',
+    'mock_interview_score': 'int8',
+    'internships_completed': 'int8',
+    'interview_rounds_cleared': 'int8'
+}
+# Two-decimal values shown to users stay float64; float32 would print
+# 84.33 as 84.330002
+FLOAT_COLUMNS = {
+    'soft_skill_avg': 'float64',
+    'avg_problems': 'float64',
+    'placement_package': 'float64',
+    'package_lpa': 'float64'
+}
+CATEGORY_COLUMNS = {'course_batch', 'placement_status', 'language', 'gender'}
+
+
+def compact_int_dtype(name, low, high):
+    """
+    INT_COLUMNS[name] if every value between low and high fits it, else
+    int64: changesets and CSV imports can carry any INT, not just the
+    generated ranges. low/high are NaN or None when there are no values.
+    """
+    dtype = INT_COLUMNS[name]
+    if pd.isna(low):
+        return dtype
+    info = np.iinfo(dtype)
+    return dtype if info.min <= low and high <= info.max else 'int64'
+
+
+def parse_package(value):
+    """Converts a package such as '12.34 LPA' (or a number/None) to LPA as a float."""
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        return float(value.split()[0]) if value.strip() else np.nan
+    return float(value)
+
+
+class _ColumnBuilder:
+    """Accumulates one result column batch by batch as typed NumPy arrays."""
+
+    def __init__(self, name):
+        self.name = name
+        self.chunks = []
+        self.categories = {} if name in CATEGORY_COLUMNS else None
+
+    def add(self, values):
+        name = self.name
+        if self.categories is not None:
+            # Dictionary-encode as we go; None maps to the missing code -1
+            codes = self.categories
+            self.chunks.append(np.array(
+                [-1 if v is None else codes.setdefault(v, len(codes)) for v in values], dtype='int32'))
+        elif name in INT_COLUMNS:
+            try:
+                self.chunks.append(np.array(values, dtype=INT_COLUMNS[name]))
+            except (TypeError, OverflowError):
+                # NULLs (TypeError) or values out of the compact dtype's range: keep
+                # them as float64, exact for any INT, and pick the dtype at the end
+                self.chunks.append(np.array(values, dtype='float64'))
+        elif name == 'placement_package':
+            self.chunks.append(np.array([parse_package(v) for v in values], dtype=FLOAT_COLUMNS[name]))
+        elif name in FLOAT_COLUMNS:
+            self.chunks.append(np.array(values, dtype=FLOAT_COLUMNS[name]))
+        else:
+            self.chunks.append(np.array(values, dtype=object))
+
+    def finish(self):
+        name = self.name
+        if self.categories is not None:
+            codes = np.concatenate(self.chunks) if self.chunks else np.empty(0, dtype='int32')
+            return pd.Categorical.from_codes(codes, categories=list(self.categories))
+        if not self.chunks:
+            dtype = INT_COLUMNS.get(name) or FLOAT_COLUMNS.get(name) or object
+            return np.empty(0, dtype=dtype)
+        column = np.concatenate(self.chunks)
+        if name in INT_COLUMNS and column.dtype.kind == 'f':
+            nulls = np.isnan(column)
+            present = column[~nulls]
+            dtype = compact_int_dtype(name, *((present.min(), present.max()) if len(present) else (None, None)))
+            return pd.array(column, dtype=dtype.capitalize()) if nulls.any() else column.astype(dtype)
+        return column
+
+
+def build_frame(columns, batches):
+    """
+    Builds a DataFrame from an iterable of row-tuple batches without creating
+    per-row dicts, converting every batch to typed column arrays as it arrives.
+    """
+    builders = [_ColumnBuilder(name) for name in columns]
+    for rows in batches:
+        if not rows:
+            continue
+        for builder, values in zip(builders, zip(*rows)):
+            builder.add(values)
+    return pd.DataFrame({builder.name: builder.finish() for builder in builders})
+
+
+def apply_dtypes(frame):
+    """Converts an already loaded frame (e.g. read from CSV) to the same dtypes as build_frame."""
+    for name in frame.columns:
+        if name in CATEGORY_COLUMNS:
+            frame[name] = frame[name].astype('category')
+        elif name in INT_COLUMNS:
+            dtype = compact_int_dtype(name, frame[name].min(), frame[name].max())
+            frame[name] = frame[name].astype(dtype if not frame[name].isna().any() else dtype.capitalize())
+        elif name == 'placement_package':
+            frame[name] = frame[name].map(parse_package, na_action='ignore').astype(FLOAT_COLUMNS[name])
+        elif name in FLOAT_COLUMNS:
+            frame[name] = frame[name].astype(FLOAT_COLUMNS[name])
+    return frame
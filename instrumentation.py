@@ -0,0 +1,98 @@
+#instrumentation.py
+import time
+import threading
+from bisect import bisect_left
+from collections import deque
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class QueryRecorder:
+    """
+    Process-wide record of the queries the app runs: a ring buffer of the
+    most recent executions plus per-label counters and latency histograms.
+    """
+
+    def __init__(self, max_recent=500):
+        self.recent = deque(maxlen=max_recent)
+        self.by_label = {}
+        self._lock = threading.Lock()
+
+    def record(self, label, query, params, wall_seconds, rows, bytes_received, frame_seconds=None):
+        entry = {
+            'label': label,
+            'wall_ms': round(wall_seconds * 1000, 3),
+            'frame_ms': round(frame_seconds * 1000, 3) if frame_seconds is not None else None,
+            'rows': rows,
+            'bytes': bytes_received,
+            'at': time.strftime('%H:%M:%S'),
+            'query': ' '.join(query.split()),
+            'params': params
+        }
+        with self._lock:
+            self.recent.append(entry)
+            stats = self.by_label.get(label)
+            if stats is None:
+                stats = self.by_label[label] = {
+                    'count': 0, 'wall_ms_total': 0.0, 'frame_ms_total': 0.0,
+                    'rows_total': 0, 'bytes_total': 0,
+                    'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1)
+                }
+            stats['count'] += 1
+            stats['wall_ms_total'] += entry['wall_ms']
+            stats['frame_ms_total'] += entry['frame_ms'] or 0.0
+            stats['rows_total'] += rows
+            stats['bytes_total'] += bytes_received
+            stats['buckets'][bisect_left(LATENCY_BUCKETS_MS, entry['wall_ms'])] += 1
+
+    def slowest(self, limit=20):
+        with self._lock:
+            recent = list(self.recent)
+        return sorted(recent, key=lambda entry: entry['wall_ms'], reverse=True)[:limit]
+
+    def export(self):
+        """Counters and cumulative histograms per label, as plain dicts."""
+        with self._lock:
+            exported = {}
+            for label, stats in self.by_label.items():
+                cumulative, running = {}, 0
+                for bound, count in zip((*LATENCY_BUCKETS_MS, '+Inf'), stats['buckets']):
+                    running += count
+                    cumulative[str(bound)] = running
+                exported[label] = {
+                    'count': stats['count'],
+                    'wall_ms_total': round(stats['wall_ms_total'], 3),
+                    'frame_ms_total': round(stats['frame_ms_total'], 3),
+                    'rows_total': stats['rows_total'],
+                    'bytes_total': stats['bytes_total'],
+                    'latency_ms_bucket': cumulative
+                }
+        return exported
+
+    def to_prometheus(self):
+        """Renders export() in the Prometheus text exposition format."""
+        lines = []
+        metrics = self.export()
+
+        def escape(label):
+            return label.replace('\\', '\\\\').replace('"', '\\"')
+
+        for name, key in (('placement_queries_total', 'count'),
+                          ('placement_query_rows_total', 'rows_total'),
+                          ('placement_query_bytes_total', 'bytes_total')):
+            lines.append(f"# TYPE {name} counter")
+            for label, stats in metrics.items():
+                lines.append(f'{name}{{label="{escape(label)}"}} {stats[key]}')
+
+        lines.append("# TYPE placement_query_latency_ms histogram")
+        for label, stats in metrics.items():
+            for bound, count in stats['latency_ms_bucket'].items():
+                lines.append(f'placement_query_latency_ms_bucket{{label="{escape(label)}",le="{bound}"}} {count}')
+            lines.append(f'placement_query_latency_ms_sum{{label="{escape(label)}"}} {stats["wall_ms_total"]}')
+            lines.append(f'placement_query_latency_ms_count{{label="{escape(label)}"}} {stats["count"]}')
+        return '\n'.join(lines) + '\n'
+
+
+# Shared by every session; imported modules survive Streamlit reruns
+RECORDER = QueryRecorder()
@@ -0,0 +1,246 @@
+#mysql_engine.py
+import time
+import itertools
+import threading
+
+import pandas as pd
+import pymysql
+
+from query_cache import QueryCache
+from frames import build_frame
+from student_store import StudentStore
+from rollups import batch_summary
+from instrumentation import RECORDER
+from queries import (
+    COURSES_SQL, OVERVIEW_COUNTS_SQL, OVERVIEW_STUDENTS_SQL, CRITERIA_SQL, INSIGHT_QUERIES,
+    DATA_VERSION_SQL, keyset_page_sql,
+    STUDENT_STORE_SQL, STUDENT_STORE_CHANGES_SQL, CHANGED_VERSIONS_SQL, criteria_by_ids_sql,
+    readiness_by_ids_sql, BATCH_ROLLUP_SQL, PACKAGE_ROLLUP_SQL
+)
+
+
+class CountingConnection(pymysql.connections.Connection):
+    """pymysql connection that counts the bytes read from the server."""
+
+    bytes_received = 0
+
+    def _read_bytes(self, num_bytes):
+        data = super()._read_bytes(num_bytes)
+        self.bytes_received += len(data)
+        return data
+
+
+class DatabaseConnection:
+    """
+    Borrows a connection from the shared pool; close() gives it back.
+    Every query is recorded in instrumentation.RECORDER under its label.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.conn = self.pool.acquire()
+        self.cursor = self.conn.cursor(pymysql.cursors.DictCursor)
+
+    def _bytes_received(self):
+        return getattr(self.conn, 'bytes_received', 0)
+
+    def fetchone(self, query, params=None, label=None):
+        started, bytes_before = time.perf_counter(), self._bytes_received()
+        self.cursor.execute(query, params)
+        row = self.cursor.fetchone()
+        RECORDER.record(label or 'unlabelled', query, params, time.perf_counter() - started,
+                        int(row is not None), self._bytes_received() - bytes_before)
+        return row
+
+    def fetchall(self, query, params=None, label=None):
+        started, bytes_before = time.perf_counter(), self._bytes_received()
+        self.cursor.execute(query, params)
+        rows = self.cursor.fetchall()
+        RECORDER.record(label or 'unlabelled', query, params, time.perf_counter() - started,
+                        len(rows), self._bytes_received() - bytes_before)
+        return rows
+
+    def _stream(self, query, params, batch_size, stats):
+        # Yields tuple batches from an SSCursor, adding the time spent in
+        # MySQL (execute + fetch) and the row count to stats
+        cursor = self.conn.cursor(pymysql.cursors.SSCursor)
+        try:
+            started = time.perf_counter()
+            cursor.execute(query, params)
+            self.columns = [column[0] for column in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                stats['db_seconds'] += time.perf_counter() - started
+                if not rows:
+                    break
+                stats['rows'] += len(rows)
+                yield rows
+                started = time.perf_counter()
+        finally:
+            cursor.close()
+
+    def iter_batches(self, query, params=None, batch_size=10000, label=None):
+        """
+        Streams the result as lists of tuples through an unbuffered SSCursor,
+        so only batch_size rows are held at a time. Column names are set on
+        self.columns once the query has run. The connection stays busy until
+        the generator is exhausted or closed.
+        """
+        stats = {'db_seconds': 0.0, 'rows': 0}
+        bytes_before = self._bytes_received()
+        try:
+            yield from self._stream(query, params, batch_size, stats)
+        finally:
+            RECORDER.record(label or 'unlabelled', query, params, stats['db_seconds'],
+                            stats['rows'], self._bytes_received() - bytes_before)
+
+    def fetch_frame(self, query, params=None, batch_size=10000, label=None):
+        """
+        Runs the query and builds a typed DataFrame straight from tuple
+        batches (see frames.py), skipping per-row dicts.
+        """
+        stats = {'db_seconds': 0.0, 'rows': 0}
+        started, bytes_before = time.perf_counter(), self._bytes_received()
+        batches = self._stream(query, params, batch_size, stats)
+        first = next(batches, None)  # executes the query and sets self.columns
+        frame = build_frame(self.columns, itertools.chain([first] if first else [], batches))
+        # Whatever was not spent waiting on MySQL went into building the frame
+        RECORDER.record(label or 'unlabelled', query, params, stats['db_seconds'], stats['rows'],
+                        self._bytes_received() - bytes_before,
+                        frame_seconds=time.perf_counter() - started - stats['db_seconds'])
+        return frame
+
+    def explain(self, query, params=None):
+        self.cursor.execute("EXPLAIN " + query, params)
+        return self.cursor.fetchall()
+
+    def close(self, discard=False):
+        self.cursor.close()
+        self.pool.release(self.conn, discard=discard)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # A connection that raised mid-query is not trusted for reuse
+        self.close(discard=exc_type is not None)
+
+class MySQLEngine:
+    """
+    Answers the views by running the SQL in queries.py against MySQL.
+    Results are cached until their TTL runs out or the loader bumps the
+    data version.
+    """
+
+    def __init__(self, pool, cache_config):
+        self.pool = pool
+        self.cache = QueryCache(**cache_config)
+        self.store = None
+        self._store_version = None
+        self._store_lock = threading.Lock()
+
+    def _data_version(self):
+        try:
+            with DatabaseConnection(self.pool) as db:
+                row = db.fetchone(DATA_VERSION_SQL, label='Data version')
+        except pymysql.err.ProgrammingError:
+            # data_version table not created yet; rely on the TTL alone
+            return None
+        return row['version'] if row else None
+
+    def fetch_frame(self, query, params=None, label=None):
+        self.cache.sync_version(self._data_version)
+
+        def load():
+            with DatabaseConnection(self.pool) as db:
+                return db.fetch_frame(query, params, label=label)
+        return self.cache.get_or_load(query, params, load)
+
+    def explain(self, query, params=None):
+        with DatabaseConnection(self.pool) as db:
+            return pd.DataFrame(db.explain(query, params))
+
+    def courses(self):
+        # Course list for the selectors, kept until the data version moves
+        self.cache.sync_version(self._data_version)
+
+        def load():
+            with DatabaseConnection(self.pool) as db:
+                return [row['course_batch'] for row in db.fetchall(COURSES_SQL, label='Courses')]
+        return self.cache.get_or_load(COURSES_SQL, None, load)
+
+    def overview(self):
+        return self.fetch_frame(OVERVIEW_COUNTS_SQL, label='Overview: counts')
+
+    def overview_students(self, course, status):
+        return self.fetch_frame(OVERVIEW_STUDENTS_SQL, (course, status), label=f"Overview: {status} students")
+
+    def batch_analytics(self):
+        # Both reads are one row per rollup group (or package bucket)
+        return batch_summary(self.fetch_frame(BATCH_ROLLUP_SQL, label='Batch analytics: groups'),
+                             self.fetch_frame(PACKAGE_ROLLUP_SQL, label='Batch analytics: packages'))
+
+    def student_store(self):
+        """
+        Returns the resident student store, building it on first use and
+        afterwards applying only the students changed by newer data versions.
+        Falls back to a rebuild when the change log does not cover the gap.
+        """
+        self.cache.sync_version(self._data_version)
+        version = self.cache.version
+        with self._store_lock:
+            if self.store is not None and version == self._store_version:
+                return self.store
+
+            with DatabaseConnection(self.pool) as db:
+                rebuild = self.store is None or version is None or self._store_version is None
+                if not rebuild:
+                    logged = db.fetchone(CHANGED_VERSIONS_SQL, (self._store_version,),
+                                         label='Student store: change log')['versions']
+                    rebuild = logged != version - self._store_version
+
+                if rebuild:
+                    store = StudentStore()
+                    for rows in db.iter_batches(STUDENT_STORE_SQL, label='Student store: build'):
+                        store.upsert_rows(rows)
+                    self.store = store
+                else:
+                    for rows in db.iter_batches(STUDENT_STORE_CHANGES_SQL, (self._store_version,),
+                                                label='Student store: update'):
+                        self.store.upsert_rows(rows)
+            self._store_version = version
+            return self.store
+
+    def _rows_by_id(self, sql_for_count, student_ids, label, chunk_size=1000):
+        # Detail rows for the given students, fetched by primary key
+        if not student_ids:
+            return pd.DataFrame()
+        with DatabaseConnection(self.pool) as db:
+            chunks = (student_ids[start:start + chunk_size] for start in range(0, len(student_ids), chunk_size))
+            batches = itertools.chain.from_iterable(
+                db.iter_batches(sql_for_count(len(chunk)), chunk, label=label)
+                for chunk in chunks)
+            first = next(batches, None)
+            return build_frame(db.columns, itertools.chain([first] if first else [], batches))
+
+    def filter_students(self, course, codekata, projects, softskills_min):
+        store = self.student_store()
+        params = (course, codekata, projects, softskills_min)
+        return self.cache.get_or_load(CRITERIA_SQL, params, lambda: self._rows_by_id(
+            criteria_by_ids_sql, store.filter(*params).tolist(), 'Criteria: matched rows'))
+
+    def insight(self, name):
+        return self.fetch_frame(INSIGHT_QUERIES[name], label=name)
+
+    def readiness_top_k(self, k, weights=None, status=None):
+        # Scored on the resident store; only the k shown rows are fetched
+        student_ids, scores = self.student_store().top_k(k, weights, status)
+        rows = self._rows_by_id(readiness_by_ids_sql, student_ids.tolist(), 'Readiness: ranked rows')
+        if rows.empty:
+            return rows
+        # Rows come back in student_id order; put them back in rank order
+        rows = rows.set_index('student_id').loc[student_ids].reset_index()
+        return rows.assign(readiness_score=scores)
+
+    def insight_page(self, name, after_id, limit):
+        return self.fetch_frame(keyset_page_sql(INSIGHT_QUERIES[name]), (after_id, limit), label=f"{name} (page)")
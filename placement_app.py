@@ -1,7 +1,9 @@
 #placement_app.py
+# Only what every rerun needs is imported here. pandas, pymysql and the data
+# engines load on first use, so the page starts rendering before they do
+import os
 import streamlit as st
-import pandas as pd
-import pymysql
+from queries import INSIGHT_QUERIES, PAGED_INSIGHTS
 
 # ----------------------------- MYSQL CONFIG -----------------------------
 DB_CONFIG = {
@@ -11,32 +13,72 @@ DB_CONFIG = {
     'database': 'placement_db'
 }
 
-# ----------------------------- DATABASE CONNECTION -----------------------------
-class DatabaseConnection:
-    def __init__(self):
-        self.conn = pymysql.connect(**DB_CONFIG)
-        self.cursor = self.conn.cursor(pymysql.cursors.DictCursor)
+# Shared connection pool limits (seconds for the timeouts)
+POOL_CONFIG = {
+    'max_size': 10,
+    'idle_timeout': 300,
+    'health_check_after': 30,
+    'wait_timeout': 10
+}
 
-    def fetchone(self, query, params=None):
-        self.cursor.execute(query, params)
-        return self.cursor.fetchone()
+# Query result cache limits (seconds for ttl and the data version check)
+CACHE_CONFIG = {
+    'max_entries': 256,
+    'ttl': 600,
+    'version_check_interval': 5
+}
 
-    def fetchall(self, query, params=None):
-        self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+# ----------------------------- BACKEND CONFIG -----------------------------
+# PLACEMENT_BACKEND=csv runs the whole app from the exported *_table.csv files
+BACKEND = os.environ.get('PLACEMENT_BACKEND', 'mysql')
+DATA_DIR = os.environ.get('PLACEMENT_DATA_DIR', os.path.dirname(os.path.abspath(__file__)))
+# PLACEMENT_ADMIN=1 shows the hidden Admin page in full. ?admin=1 in the URL
+# only shows its aggregate metrics: anyone can set it, so it is not access
+# control, and query text and EXPLAIN stay behind the environment variable
+ADMIN = os.environ.get('PLACEMENT_ADMIN') == '1'
 
-    def close(self):
-        self.conn.close()
+# ----------------------------- DATABASE CONNECTION -----------------------------
+@st.cache_resource
+def get_pool():
+    # One pool per process, kept across Streamlit reruns and sessions.
+    # autocommit stops reused connections from reading an old snapshot.
+    # CountingConnection tracks bytes received for the query instrumentation
+    from db_pool import ConnectionPool
+    from mysql_engine import CountingConnection
+    return ConnectionPool(lambda: CountingConnection(autocommit=True, **DB_CONFIG), **POOL_CONFIG)
+
+# ----------------------------- DATA ENGINES -----------------------------
+@st.cache_resource
+def get_engine():
+    # Built once per process and shared by every session and rerun
+    if BACKEND == 'csv':
+        from csv_engine import CsvEngine
+        return CsvEngine(DATA_DIR)
+    from mysql_engine import MySQLEngine
+    return MySQLEngine(get_pool(), CACHE_CONFIG)
 
 # ----------------------------- MENU 1: OVERVIEW -----------------------------
+def course_count(counts, course=None, status=None):
+    if counts.empty:
+        return 0
+    if course is not None:
+        counts = counts[counts['course_batch'] == course]
+    if status is not None:
+        counts = counts[counts['placement_status'] == status]
+    return int(counts['students'].sum())
+
 def show_overview():
     st.header("📊 Overview of Placement Data")
-    db = DatabaseConnection()
+
+    # One grouped count query feeds every metric below; the student lists
+    # are fetched for the selected course only and cached per course
+    engine = get_engine()
+    counts = engine.overview()
 
     # Get totals
-    total_students = db.fetchone("SELECT COUNT(*) as total_students FROM students")['total_students']
-    total_placed = db.fetchone("SELECT COUNT(*) as total_placed FROM placements WHERE placement_status = 'Placed'")['total_placed']
-    total_ready = db.fetchone("SELECT COUNT(*) as total_ready FROM placements WHERE placement_status = 'Ready'")['total_ready']
+    total_students = course_count(counts)
+    total_placed = course_count(counts, status='Placed')
+    total_ready = course_count(counts, status='Ready')
 
     total_not_placed = total_students - total_placed
     total_not_ready = total_students - total_placed - total_ready
@@ -58,13 +100,8 @@ def show_overview():
 
     # Placed Students by Course
     course = st.selectbox("🎯 Filter Placed Students by Course", get_courses())
-    placed_query = '''
-        SELECT s.student_id, s.name, s.email, s.phone, pl.company_name, pl.placement_package
-        FROM students s
-        JOIN placements pl ON s.student_id = pl.student_id
-        WHERE pl.placement_status = 'Placed' AND s.course_batch = %s
-    '''
-    placed_students = pd.DataFrame(db.fetchall(placed_query, (course,)))
+    placed_students = engine.overview_students(course, 'Placed')
+    st.caption(f"{course_count(counts, course, 'Placed')} of {course_count(counts, course)} students placed in {course}")
 
     if not placed_students.empty:
         st.subheader("✅ Placed Students")
@@ -76,13 +113,9 @@ def show_overview():
 
     # Ready Students by Course
     ready_course = st.selectbox("📌 Filter Ready Students by Course", get_courses())
-    ready_query = '''
-        SELECT s.student_id, s.name, s.email, s.phone
-        FROM students s
-        JOIN placements pl ON s.student_id = pl.student_id
-        WHERE pl.placement_status = 'Ready' AND s.course_batch = %s
-    '''
-    ready_students = pd.DataFrame(db.fetchall(ready_query, (ready_course,)))
+    ready_students = engine.overview_students(ready_course, 'Ready')
+    ready_students = ready_students[['student_id', 'name', 'email', 'phone']]
+    st.caption(f"{course_count(counts, ready_course, 'Ready')} of {course_count(counts, ready_course)} students ready in {ready_course}")
 
     if not ready_students.empty:
         st.subheader("🟢 Ready Students")
@@ -90,8 +123,6 @@ def show_overview():
     else:
         st.info("No students in Ready state for the selected course.")
 
-    db.close()
-
 # ----------------------------- MENU 2: FILTER BY CRITERIA -----------------------------
 def show_criteria_dashboard():
     st.header("🎯 Filter by Criteria")
@@ -114,33 +145,8 @@ def show_criteria_dashboard():
 
     # Button click triggers filter
     if st.button("🔍 Filter the Students"):
-        db = DatabaseConnection()
-
-        # SQL Query with >= for mini projects and soft skills
-        query = '''
-            SELECT s.student_id, s.name, s.email, s.phone, s.course_batch,
-                   p.language, p.problems_solved, p.mini_projects,
-                   ss.communication, ss.teamwork, ss.presentation, ss.leadership,
-                   ss.critical_thinking, ss.interpersonal_skills,
-                   ROUND((ss.communication + ss.teamwork + ss.presentation + ss.leadership +
-                          ss.critical_thinking + ss.interpersonal_skills) / 6.0, 2) AS soft_skill_avg,
-                   pl.placement_status
-            FROM students s
-            JOIN programming p ON s.student_id = p.student_id
-            JOIN soft_skills ss ON s.student_id = ss.student_id
-            JOIN placements pl ON s.student_id = pl.student_id
-            WHERE s.course_batch = %s
-              AND p.problems_solved >= %s
-              AND p.mini_projects >= %s
-              AND ROUND((ss.communication + ss.teamwork + ss.presentation + ss.leadership +
-                         ss.critical_thinking + ss.interpersonal_skills) / 6.0, 2) >= %s
-              AND pl.placement_status != 'Placed'
-        '''
-
         # Run query with inputs
-        filtered_students = pd.DataFrame(
-            db.fetchall(query, (course, codekata, projects, softskills_min))
-        )
+        filtered_students = get_engine().filter_students(course, codekata, projects, softskills_min)
 
         # Display results
         if not filtered_students.empty:
@@ -148,105 +154,216 @@ def show_criteria_dashboard():
             st.dataframe(filtered_students, use_container_width=True)
         else:
             st.info("🔍 No students matched the given criteria.")
-        db.close()
 
 
 # ----------------------------- get_courses FUNCTION -----------------------------
 def get_courses():
-    return [
-        "Data Science", "Full Stack Development", "Automation & Testing",
-        "UI/UX", "DevOps", "Data Engineering", "Business Analytics with Digital Marketing"
-    ]
+    # SELECT DISTINCT course_batch, cached by the process-wide engine until the data changes
+    return get_engine().courses()
 
 # ----------------------------- MENU 3: INSIGHTS -----------------------------
 def show_insights():
     st.header("📊 Insights from SQL Queries")
-    options = {
-        "Top 5 students ready for placement": '''
-            SELECT s.student_id, s.name, s.course_batch,
-                   ROUND((ss.communication + ss.teamwork + ss.presentation + ss.leadership +
-                          ss.critical_thinking + ss.interpersonal_skills)/6, 2) as soft_skill_avg,
-                   p.problems_solved
-            FROM students s
-            JOIN soft_skills ss ON s.student_id = ss.student_id
-            JOIN programming p ON s.student_id = p.student_id
-            JOIN placements pl ON s.student_id = pl.student_id
-            WHERE pl.placement_status = 'Ready'
-            ORDER BY soft_skill_avg DESC, p.problems_solved DESC
-            LIMIT 5
-        ''',
-        "Distribution of soft skills scores": '''
-            SELECT s.student_id, s.name, ss.communication, ss.teamwork, ss.presentation, ss.leadership, ss.critical_thinking, ss.interpersonal_skills
-            FROM students s
-            JOIN soft_skills ss ON s.student_id = ss.student_id
-        ''',
-        "Top 20 performing students in mock interview": '''
-            SELECT s.student_id, s.name, pl.mock_interview_score
-            FROM students s
-            JOIN placements pl ON s.student_id = pl.student_id
-            ORDER BY pl.mock_interview_score DESC
-            LIMIT 20
-        ''',
-        "Top 10 students with highest package": '''
-            SELECT s.student_id, s.name, pl.company_name, pl.placement_package
-            FROM students s
-            JOIN placements pl ON s.student_id = pl.student_id
-            WHERE pl.placement_status = 'Placed'
-            ORDER BY pl.placement_package DESC
-            LIMIT 10
-        ''',
-        "Students with more than 4 certificates": '''
-            SELECT s.student_id, s.name, p.certifications_earned
-            FROM students s
-            JOIN programming p ON s.student_id = p.student_id
-            WHERE p.certifications_earned > 4
-        ''',
-        "Join all student tables": '''
-            SELECT s.student_id, s.name, s.email, s.course_batch,
-                   p.language, p.problems_solved, p.certifications_earned,
-                   ss.communication, ss.teamwork, ss.presentation,
-                   ss.leadership, ss.critical_thinking, ss.interpersonal_skills,
-                   pl.placement_status, pl.company_name, pl.placement_package
-            FROM students s
-            JOIN programming p ON s.student_id = p.student_id
-            JOIN soft_skills ss ON s.student_id = ss.student_id
-            JOIN placements pl ON s.student_id = pl.student_id
-        ''',
-        "Top mini project performers": '''
-            SELECT s.student_id, s.name, p.mini_projects
-            FROM students s
-            JOIN programming p ON s.student_id = p.student_id
-            WHERE p.mini_projects IN (9, 10)
-        ''',
-        "Students graduating this year": '''
-            SELECT student_id, name, graduation_year
-            FROM students
-            WHERE graduation_year = YEAR(CURDATE())
-        ''',
-        "Students with more than 2 internships": '''
-            SELECT s.student_id, s.name, pl.internships_completed
-            FROM students s
-            JOIN placements pl ON s.student_id = pl.student_id
-            WHERE pl.internships_completed > 2
-        ''',
-        "Average programming performance per batch": '''
-            SELECT s.course_batch, ROUND(AVG(p.problems_solved), 2) AS avg_problems
-            FROM students s JOIN programming p ON s.student_id = p.student_id
-            GROUP BY s.course_batch
-        '''
-    }
-
-    selected_query = st.selectbox("📌 Choose an insight to explore", list(options.keys()))
-    db = DatabaseConnection()
-    df = pd.DataFrame(db.fetchall(options[selected_query]))
+    selected_query = st.selectbox("📌 Choose an insight to explore", list(INSIGHT_QUERIES.keys()))
+    if selected_query in PAGED_INSIGHTS:
+        show_paged_insight(selected_query)
+        return
+    df = get_engine().insight(selected_query)
+    st.dataframe(df, use_container_width=True)
+
+    if selected_query == "Top 5 students ready for placement":
+        show_readiness_ranking()
+
+def show_readiness_ranking():
+    from csv_engine import SOFT_SKILL_COLUMNS
+    from scoring import READINESS_WEIGHTS
+    with st.expander("⚖️ Weighted readiness ranking"):
+        st.caption("Ranks Ready students by a weighted score of skills, practice and experience (0-100).")
+        col1, col2 = st.columns(2)
+        # Rounded so float noise from the sum stays on the slider's 0.05 steps
+        soft_skills_default = round(sum(READINESS_WEIGHTS[name] for name in SOFT_SKILL_COLUMNS), 2)
+        soft_skills = col1.slider("Soft skills (all six)", 0.0, 1.0, soft_skills_default, 0.05)
+        problems = col1.slider("CodeKata problems solved", 0.0, 1.0, READINESS_WEIGHTS['problems_solved'], 0.05)
+        projects = col1.slider("Mini projects", 0.0, 1.0, READINESS_WEIGHTS['mini_projects'], 0.05)
+        latest = col1.slider("Latest project score", 0.0, 1.0, READINESS_WEIGHTS['latest_project_score'], 0.05)
+        mock = col2.slider("Mock interview score", 0.0, 1.0, READINESS_WEIGHTS['mock_interview_score'], 0.05)
+        internships = col2.slider("Internships", 0.0, 1.0, READINESS_WEIGHTS['internships_completed'], 0.05)
+        certifications = col2.slider("Certifications", 0.0, 1.0, READINESS_WEIGHTS['certifications_earned'], 0.05)
+        top_k = col2.number_input("Students to show", min_value=1, max_value=100, value=5)
+
+        weights = {name: soft_skills / len(SOFT_SKILL_COLUMNS) for name in SOFT_SKILL_COLUMNS}
+        weights.update({
+            'problems_solved': problems, 'mini_projects': projects, 'latest_project_score': latest,
+            'mock_interview_score': mock, 'internships_completed': internships, 'certifications_earned': certifications
+        })
+        st.dataframe(get_engine().readiness_top_k(int(top_k), weights, status='Ready'), use_container_width=True)
+
+def show_paged_insight(name):
+    # Fetch only the visible page; the session keeps the last student_id of
+    # each previous page so Previous/Next are keyset lookups
+    page_size = st.selectbox("Rows per page", [50, 100, 500, 1000], index=1)
+    page_keys = st.session_state.setdefault(f"page_keys::{name}::{page_size}", [0])
+
+    df = get_engine().insight_page(name, page_keys[-1], page_size)
     st.dataframe(df, use_container_width=True)
-    db.close()
+
+    col_prev, col_page, col_next = st.columns(3)
+    if col_prev.button("⬅️ Previous", disabled=len(page_keys) == 1):
+        page_keys.pop()
+        st.rerun()
+    col_page.caption(f"Page {len(page_keys)}")
+    if col_next.button("Next ➡️", disabled=len(df) < page_size):
+        page_keys.append(int(df['student_id'].iloc[-1]))
+        st.rerun()
+    st.caption(f'Full result as CSV, streamed from MySQL: `python csv_tools.py export --insight "{name}"`')
+
+# ----------------------------- MENU 4: BATCH ANALYTICS -----------------------------
+def show_batch_analytics():
+    st.header("📈 Batch Analytics")
+    st.caption("Per course, enrollment year and placement status, from the pre-aggregated rollup tables. "
+               "Package percentiles are in LPA, to the nearest 0.1 LPA below.")
+
+    summary = get_engine().batch_analytics()
+    course = st.selectbox("🎯 Course", ["All courses", *get_courses()])
+    if course != "All courses":
+        summary = summary[summary['course_batch'] == course].reset_index(drop=True)
+
+    if summary.empty:
+        st.info("No rollup data for the selected course.")
+    else:
+        st.dataframe(summary, use_container_width=True)
+
+# ----------------------------- MENU 5: DRIVE MATCHING -----------------------------
+DRIVE_COLUMNS = ['drive', 'course', 'codekata', 'projects', 'softskills_min']
+# Accepted cutoff ranges, the scales of the underlying columns
+DRIVE_CUTOFF_RANGES = {'codekata': (0, 600), 'projects': (0, 10), 'softskills_min': (0, 100)}
+
+def read_drives(upload):
+    """Parses an uploaded drives CSV. Returns (drives frame, None) or (None, error message)."""
+    import pandas as pd
+    try:
+        # Blank lines are kept (and dropped below) so the index still maps to file lines
+        drives = pd.read_csv(upload, dtype={'drive': str, 'course': str}, skipinitialspace=True,
+                             skip_blank_lines=False)
+    except (ValueError, pd.errors.ParserError) as exc:
+        return None, f"Could not read the CSV: {exc}"
+
+    missing = [column for column in DRIVE_COLUMNS if column not in drives.columns]
+    if missing:
+        return None, f"Missing columns: {', '.join(missing)}"
+    drives = drives[DRIVE_COLUMNS].dropna(how='all')
+    cutoffs = drives[list(DRIVE_CUTOFF_RANGES)].apply(pd.to_numeric, errors='coerce')
+
+    def lines(invalid):
+        return ', '.join(str(row + 2) for row in drives.index[invalid][:10])  # +2: header and 1-based
+
+    invalid = cutoffs.isna().any(axis=1) | drives['drive'].isna() | drives['course'].isna()
+    if invalid.any():
+        return None, f"Missing or non-numeric values on line(s) {lines(invalid)}"
+    # between() is False for inf, so this also rejects non-finite cutoffs
+    out_of_range = ~pd.concat([cutoffs[column].between(low, high)
+                               for column, (low, high) in DRIVE_CUTOFF_RANGES.items()], axis=1).all(axis=1)
+    if out_of_range.any():
+        ranges = ', '.join(f"{column} {low}-{high}" for column, (low, high) in DRIVE_CUTOFF_RANGES.items())
+        return None, f"Cutoffs out of range ({ranges}) on line(s) {lines(out_of_range)}"
+    if drives.empty:
+        return None, "The CSV has no drives."
+    return drives.assign(**cutoffs).reset_index(drop=True), None
+
+def show_drive_matching():
+    import numpy as np
+    import pandas as pd
+    st.header("🏢 Drive Matching")
+    st.caption("Upload the placement drives as a CSV with the columns drive, course, codekata, projects and "
+               "softskills_min. Every drive is matched against the whole cohort at once; cutoffs are minimums "
+               "and placed students are left out, as in Filter by Criteria.")
+
+    upload = st.file_uploader("📥 Drives CSV", type='csv')
+    if upload is None:
+        return
+    drives, error = read_drives(upload)
+    if error:
+        st.error(error)
+        return
+
+    criteria = drives[['course', 'codekata', 'projects', 'softskills_min']].itertuples(index=False, name=None)
+    student_ids, drive_indexes = get_engine().student_store().match_drives(list(criteria))
+
+    st.subheader("📋 Eligible Students per Drive")
+    unknown = ~drives['course'].isin(get_courses())
+    if unknown.any():
+        st.warning(f"⚠️ Unknown course(s): {', '.join(drives.loc[unknown, 'course'].unique())}")
+    st.dataframe(drives.assign(eligible_students=np.bincount(drive_indexes, minlength=len(drives))),
+                 use_container_width=True)
+
+    st.subheader("🎓 Drives per Student")
+    if not len(student_ids):
+        st.info("🔍 No students qualify for any drive.")
+        return
+    # Every drive a student matches is for the student's own course
+    matches = (pd.DataFrame({'student_id': student_ids,
+                             'course_batch': drives['course'].to_numpy()[drive_indexes],
+                             'drive': drives['drive'].to_numpy()[drive_indexes]})
+               .groupby('student_id', sort=False)
+               .agg(course_batch=('course_batch', 'first'), drives_matched=('drive', 'size'),
+                    drives=('drive', ', '.join))
+               .reset_index())
+    st.dataframe(matches, use_container_width=True)
+    st.download_button("⬇️ Download matches", matches.to_csv(index=False),
+                       file_name="drive_matches.csv", mime="text/csv")
+
+# ----------------------------- ADMIN: QUERY PERFORMANCE -----------------------------
+def show_admin():
+    import pandas as pd
+    from instrumentation import RECORDER
+    st.header("🛠️ Query Performance")
+
+    metrics = RECORDER.export()
+    if metrics:
+        summary = pd.DataFrame([
+            {'label': label, 'queries': stats['count'],
+             'avg_ms': round(stats['wall_ms_total'] / stats['count'], 3),
+             'avg_frame_ms': round(stats['frame_ms_total'] / stats['count'], 3),
+             'rows': stats['rows_total'], 'bytes': stats['bytes_total']}
+            for label, stats in metrics.items()
+        ]).sort_values('avg_ms', ascending=False)
+        st.subheader("Per-query totals")
+        st.dataframe(summary, use_container_width=True)
+
+    slowest = RECORDER.slowest()
+    st.subheader("🐢 Slowest recent queries")
+    if not slowest:
+        st.info("No queries recorded yet.")
+    else:
+        st.dataframe(pd.DataFrame(slowest).drop(columns=['query', 'params']), use_container_width=True)
+        if not ADMIN:
+            st.info("🔒 Query text and EXPLAIN plans need PLACEMENT_ADMIN=1 on the server.")
+        else:
+            choice = st.selectbox("EXPLAIN query", range(len(slowest)),
+                                  format_func=lambda i: f"{slowest[i]['label']} ({slowest[i]['wall_ms']} ms)")
+            entry = slowest[choice]
+            st.code(entry['query'], language='sql')
+            if BACKEND == 'mysql':
+                st.dataframe(get_engine().explain(entry['query'], entry['params']), use_container_width=True)
+
+    with st.expander("📈 Prometheus metrics"):
+        st.code(RECORDER.to_prometheus(), language='text')
+    with st.expander("🧮 Student store"):
+        st.json(get_engine().student_store().stats())
+    if BACKEND == 'mysql':
+        with st.expander("🔌 Connection pool"):
+            st.json(get_pool().metrics())
+        with st.expander("🗃️ Query cache"):
+            st.json(get_engine().cache.stats)
 
 # ----------------------------- MAIN APP -----------------------------
 def main():
     st.set_page_config(page_title="Placement Eligibility App", layout="wide")
     st.sidebar.title("📚 Placement App Menu")
-    menu = st.sidebar.radio("Navigate", ("Overview", "Filter by Criteria", "Insights"))
+    pages = ["Overview", "Filter by Criteria", "Insights", "Batch Analytics", "Drive Matching"]
+    if ADMIN or st.query_params.get('admin') == '1':
+        pages.append("Admin")
+    menu = st.sidebar.radio("Navigate", pages)
 
     if menu == "Overview":
         show_overview()
@@ -254,6 +371,12 @@ def main():
         show_criteria_dashboard()
     elif menu == "Insights":
         show_insights()
+    elif menu == "Batch Analytics":
+        show_batch_analytics()
+    elif menu == "Drive Matching":
+        show_drive_matching()
+    elif menu == "Admin":
+        show_admin()
 
 if __name__ == '__main__':
     main()
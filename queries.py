@@ -0,0 +1,305 @@
+#queries.py
+# SQL used by the MySQL backend of placement_app.py, kept in one place so the
+# app, the loader and any tooling run exactly the same statements.
+
+# ----------------------------- DATA VERSION -----------------------------
+# Bumped by data_insertion.py after every load; the app drops cached results when it moves
+DATA_VERSION_SQL = "SELECT version FROM data_version WHERE id = 1"
+
+# ----------------------------- COURSES -----------------------------
+# Course list of the selectors; idx_students_course_batch answers it from the index
+COURSES_SQL = "SELECT DISTINCT course_batch FROM students WHERE course_batch IS NOT NULL ORDER BY course_batch"
+
+# ----------------------------- OVERVIEW -----------------------------
+# Per-course, per-status student counts; every metric on the page is derived
+# from it. Read from batch_rollup, so the cost is per group, not per student
+OVERVIEW_COUNTS_SQL = '''
+    SELECT NULLIF(course_batch, '') AS course_batch, NULLIF(placement_status, '') AS placement_status,
+           CAST(SUM(students) AS SIGNED) AS students
+    FROM batch_rollup
+    GROUP BY course_batch, placement_status
+'''
+
+# Students of one course with one placement status, fetched for the
+# course picked on the page and cached per (course, status)
+OVERVIEW_STUDENTS_SQL = '''
+    SELECT s.student_id, s.name, s.email, s.phone, pl.company_name, pl.placement_package
+    FROM students s
+    JOIN placements pl ON s.student_id = pl.student_id
+    WHERE s.course_batch = %s AND pl.placement_status = %s
+    ORDER BY s.student_id
+'''
+
+# ----------------------------- FILTER BY CRITERIA -----------------------------
+# SQL Query with >= for mini projects and soft skills.
+# soft_skill_avg is a stored generated column so the threshold can use its index.
+CRITERIA_SQL = '''
+    SELECT s.student_id, s.name, s.email, s.phone, s.course_batch,
+           p.language, p.problems_solved, p.mini_projects,
+           ss.communication, ss.teamwork, ss.presentation, ss.leadership,
+           ss.critical_thinking, ss.interpersonal_skills,
+           ss.soft_skill_avg,
+           pl.placement_status
+    FROM students s
+    JOIN programming p ON s.student_id = p.student_id
+    JOIN soft_skills ss ON s.student_id = ss.student_id
+    JOIN placements pl ON s.student_id = pl.student_id
+    WHERE s.course_batch = %s
+      AND p.problems_solved >= %s
+      AND p.mini_projects >= %s
+      AND ss.soft_skill_avg >= %s
+      AND pl.placement_status != 'Placed'
+'''
+
+# Number of versions after a given one that have recorded changes; if it is
+# short of the version gap the change log is incomplete and the store is rebuilt
+CHANGED_VERSIONS_SQL = "SELECT COUNT(DISTINCT version) AS versions FROM data_changes WHERE version > %s"
+
+
+# The joined record kept resident by student_store.StudentStore, in its column order
+STUDENT_STORE_SQL = '''
+    SELECT s.student_id, s.course_batch, s.enrollment_year, pl.placement_status,
+           p.language, p.problems_solved, p.assessments_completed, p.mini_projects,
+           p.certifications_earned, p.latest_project_score,
+           ss.communication, ss.teamwork, ss.presentation, ss.leadership,
+           ss.critical_thinking, ss.interpersonal_skills, ss.soft_skill_avg,
+           pl.mock_interview_score, pl.internships_completed, pl.interview_rounds_cleared,
+           pl.company_name, pl.package_lpa
+    FROM students s
+    JOIN programming p ON s.student_id = p.student_id
+    JOIN soft_skills ss ON s.student_id = ss.student_id
+    JOIN placements pl ON s.student_id = pl.student_id
+'''
+
+# Students touched by loads after a given data version
+STUDENT_STORE_CHANGES_SQL = STUDENT_STORE_SQL.rstrip() + '''
+    JOIN (SELECT DISTINCT first_student_id, last_student_id
+          FROM data_changes WHERE version > %s) c
+      ON s.student_id BETWEEN c.first_student_id AND c.last_student_id
+'''
+
+
+def _by_ids_sql(query, count):
+    select = query[:query.index('WHERE')] if 'WHERE' in query else query.rstrip() + '\n    '
+    placeholders = ', '.join(['%s'] * count)
+    return f"{select}WHERE s.student_id IN ({placeholders})\n    ORDER BY s.student_id\n"
+
+
+def criteria_by_ids_sql(count):
+    """The criteria filter's columns for `count` student_ids matched by the student store."""
+    return _by_ids_sql(CRITERIA_SQL, count)
+
+# ----------------------------- READINESS RANKING -----------------------------
+# Columns shown by the readiness ranking; the student store computes the
+# scores and readiness_by_ids_sql() fetches only the top rows
+READINESS_COLUMNS_SQL = '''
+    SELECT s.student_id, s.name, s.course_batch, pl.placement_status,
+           ss.communication, ss.teamwork, ss.presentation, ss.leadership,
+           ss.critical_thinking, ss.interpersonal_skills,
+           p.problems_solved, p.mini_projects, p.certifications_earned, p.latest_project_score,
+           pl.mock_interview_score, pl.internships_completed
+    FROM students s
+    JOIN programming p ON s.student_id = p.student_id
+    JOIN soft_skills ss ON s.student_id = ss.student_id
+    JOIN placements pl ON s.student_id = pl.student_id
+'''
+
+
+def readiness_by_ids_sql(count):
+    """The readiness ranking's columns for `count` student_ids ranked by the student store."""
+    return _by_ids_sql(READINESS_COLUMNS_SQL, count)
+
+# ----------------------------- INSIGHTS -----------------------------
+INSIGHT_QUERIES = {
+    "Top 5 students ready for placement": '''
+        SELECT s.student_id, s.name, s.course_batch, ss.soft_skill_avg,
+               p.problems_solved
+        FROM students s
+        JOIN soft_skills ss ON s.student_id = ss.student_id
+        JOIN programming p ON s.student_id = p.student_id
+        JOIN placements pl ON s.student_id = pl.student_id
+        WHERE pl.placement_status = 'Ready'
+        ORDER BY ss.soft_skill_avg DESC, p.problems_solved DESC
+        LIMIT 5
+    ''',
+    "Distribution of soft skills scores": '''
+        SELECT s.student_id, s.name, ss.communication, ss.teamwork, ss.presentation, ss.leadership, ss.critical_thinking, ss.interpersonal_skills
+        FROM students s
+        JOIN soft_skills ss ON s.student_id = ss.student_id
+    ''',
+    "Top 20 performing students in mock interview": '''
+        SELECT s.student_id, s.name, pl.mock_interview_score
+        FROM students s
+        JOIN placements pl ON s.student_id = pl.student_id
+        ORDER BY pl.mock_interview_score DESC
+        LIMIT 20
+    ''',
+    # package_lpa is the numeric copy of placement_package; (placement_status,
+    # package_lpa) is indexed so this reads the top 10 in order without a filesort
+    "Top 10 students with highest package": '''
+        SELECT s.student_id, s.name, pl.company_name, pl.placement_package
+        FROM placements pl
+        JOIN students s ON s.student_id = pl.student_id
+        WHERE pl.placement_status = 'Placed'
+        ORDER BY pl.package_lpa DESC
+        LIMIT 10
+    ''',
+    "Students with more than 4 certificates": '''
+        SELECT s.student_id, s.name, p.certifications_earned
+        FROM students s
+        JOIN programming p ON s.student_id = p.student_id
+        WHERE p.certifications_earned > 4
+    ''',
+    "Join all student tables": '''
+        SELECT s.student_id, s.name, s.email, s.course_batch,
+               p.language, p.problems_solved, p.certifications_earned,
+               ss.communication, ss.teamwork, ss.presentation,
+               ss.leadership, ss.critical_thinking, ss.interpersonal_skills,
+               pl.placement_status, pl.company_name, pl.placement_package
+        FROM students s
+        JOIN programming p ON s.student_id = p.student_id
+        JOIN soft_skills ss ON s.student_id = ss.student_id
+        JOIN placements pl ON s.student_id = pl.student_id
+    ''',
+    "Top mini project performers": '''
+        SELECT s.student_id, s.name, p.mini_projects
+        FROM students s
+        JOIN programming p ON s.student_id = p.student_id
+        WHERE p.mini_projects IN (9, 10)
+    ''',
+    "Students graduating this year": '''
+        SELECT student_id, name, graduation_year
+        FROM students
+        WHERE graduation_year = YEAR(CURDATE())
+    ''',
+    "Students with more than 2 internships": '''
+        SELECT s.student_id, s.name, pl.internships_completed
+        FROM students s
+        JOIN placements pl ON s.student_id = pl.student_id
+        WHERE pl.internships_completed > 2
+    ''',
+    "Average programming performance per batch": '''
+        SELECT NULLIF(course_batch, '') AS course_batch,
+               ROUND(SUM(problems_sum) / SUM(problems_count), 2) AS avg_problems
+        FROM batch_rollup
+        GROUP BY course_batch
+        HAVING SUM(problems_count) > 0
+    '''
+}
+
+# Insights that return one row per student; the app pages through these with
+# keyset pagination on student_id instead of loading the whole result
+PAGED_INSIGHTS = ("Distribution of soft skills scores", "Join all student tables")
+
+
+def keyset_page_sql(query):
+    """
+    Adds keyset pagination on s.student_id to an insight query that has no
+    WHERE clause. Params: (last student_id of the previous page, page size).
+    """
+    return query.rstrip() + '''
+        WHERE s.student_id > %s
+        ORDER BY s.student_id
+        LIMIT %s
+'''
+
+# ----------------------------- ROLLUPS -----------------------------
+# Pre-aggregated analytics per (course_batch, enrollment_year, placement_status)
+# group, kept up to date by data_insertion.py. Missing keys are stored as
+# '' / 0 because they are part of the primary key. package_rollup is a
+# histogram of placement packages in 0.1 LPA buckets (package_tenths), so
+# percentiles can be read off it without touching the students.
+ROLLUP_COLUMNS = {
+    'batch_rollup': (
+        ['course_batch', 'enrollment_year', 'placement_status'],
+        ['students', 'problems_count', 'problems_sum', 'problems_min', 'problems_max',
+         'soft_skill_count', 'soft_skill_sum']
+    ),
+    'package_rollup': (
+        ['course_batch', 'enrollment_year', 'placement_status', 'package_tenths'],
+        ['students']
+    )
+}
+
+_ROLLUP_FROM = '''
+    FROM students s
+    LEFT JOIN programming p ON s.student_id = p.student_id
+    LEFT JOIN soft_skills ss ON s.student_id = ss.student_id
+    LEFT JOIN placements pl ON s.student_id = pl.student_id
+'''
+_ROLLUP_KEYS = '''
+    SELECT COALESCE(s.course_batch, '') AS course_batch,
+           COALESCE(s.enrollment_year, 0) AS enrollment_year,
+           COALESCE(pl.placement_status, '') AS placement_status'''
+
+# Conditions for the select functions below. Students recorded in data_changes
+# for one data version (param: version)
+CHANGED_STUDENTS_FILTER = '''
+    JOIN data_changes c ON s.student_id BETWEEN c.first_student_id AND c.last_student_id
+    WHERE c.version = %s
+'''
+# Students of one (course_batch, enrollment_year) cell, as stored in the rollups
+ROLLUP_CELL_FILTER = "WHERE s.course_batch <=> NULLIF(%s, '') AND s.enrollment_year <=> NULLIF(%s, 0)"
+
+
+def batch_rollup_select_sql(condition=''):
+    """batch_rollup rows aggregated over the students matched by condition (JOIN and/or WHERE)."""
+    return f'''{_ROLLUP_KEYS},
+           COUNT(*) AS students,
+           COUNT(p.problems_solved) AS problems_count,
+           COALESCE(SUM(p.problems_solved), 0) AS problems_sum,
+           MIN(p.problems_solved) AS problems_min,
+           MAX(p.problems_solved) AS problems_max,
+           COUNT(ss.soft_skill_avg) AS soft_skill_count,
+           COALESCE(SUM(ss.soft_skill_avg), 0) AS soft_skill_sum
+    {_ROLLUP_FROM.strip()}
+    {condition.strip()}
+    GROUP BY 1, 2, 3
+'''
+
+
+def package_rollup_select_sql(condition=''):
+    """package_rollup rows for the placed students matched by condition (JOIN and/or WHERE)."""
+    return f'''{_ROLLUP_KEYS},
+           FLOOR(pl.package_lpa * 10) AS package_tenths,
+           COUNT(*) AS students
+    FROM students s
+    JOIN placements pl ON s.student_id = pl.student_id AND pl.package_lpa IS NOT NULL
+    {condition.strip()}
+    GROUP BY 1, 2, 3, 4
+'''
+
+
+def rollup_merge_sql(table, select_sql):
+    """
+    INSERT ... SELECT that adds the selected rollup rows to table: counts and
+    sums are added to existing groups, minimums and maximums combined.
+    """
+    keys, values = ROLLUP_COLUMNS[table]
+    merges = []
+    for column in values:
+        if column.endswith(('_min', '_max')):
+            pick = 'LEAST' if column.endswith('_min') else 'GREATEST'
+            merges.append(f"{column} = {pick}(COALESCE({table}.{column}, delta.{column}), "
+                          f"COALESCE(delta.{column}, {table}.{column}))")
+        else:
+            merges.append(f"{column} = {table}.{column} + delta.{column}")
+    return f'''
+    INSERT INTO {table} ({', '.join(keys + values)})
+    SELECT * FROM ({select_sql}) AS delta
+    ON DUPLICATE KEY UPDATE {', '.join(merges)}
+'''
+
+# What the Batch Analytics page reads; see rollups.batch_summary
+BATCH_ROLLUP_SQL = '''
+    SELECT NULLIF(course_batch, '') AS course_batch, NULLIF(enrollment_year, 0) AS enrollment_year,
+           NULLIF(placement_status, '') AS placement_status,
+           students, problems_count, problems_sum, problems_min, problems_max,
+           soft_skill_count, soft_skill_sum
+    FROM batch_rollup
+'''
+PACKAGE_ROLLUP_SQL = '''
+    SELECT NULLIF(course_batch, '') AS course_batch, NULLIF(enrollment_year, 0) AS enrollment_year,
+           NULLIF(placement_status, '') AS placement_status, package_tenths, students
+    FROM package_rollup
+'''
@@ -0,0 +1,86 @@
+#query_cache.py
+import time
+import threading
+from collections import OrderedDict
+
+
+class QueryCache:
+    """
+    Size-bounded LRU cache of query results with a TTL. Entries are keyed by
+    SQL text and params. The whole cache is dropped when the data version
+    published by data_insertion.py changes; the version itself is looked up
+    at most once every version_check_interval seconds, so repeat views are
+    served without touching the database.
+    """
+
+    def __init__(self, max_entries=256, ttl=600, version_check_interval=5):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version_check_interval = version_check_interval
+
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._version = None
+        self._version_checked_at = None
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    @staticmethod
+    def make_key(query, params=None):
+        # Normalise whitespace so the same statement always maps to one entry
+        return ' '.join(query.split()), tuple(params) if params is not None else None
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def get_or_load(self, query, params, loader):
+        """
+        Returns the cached result for (query, params), calling loader() and
+        storing its result on a miss. None results are not cached.
+        """
+        key = self.make_key(query, params)
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def sync_version(self, fetch_version):
+        """
+        Calls fetch_version() if the last check is older than
+        version_check_interval and clears the cache when the version moved.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._version_checked_at is not None and now - self._version_checked_at < self.version_check_interval:
+                return
+            self._version_checked_at = now
+
+        version = fetch_version()
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._entries.clear()
+                self.stats['invalidations'] += 1
+
+    @property
+    def version(self):
+        """The data version seen by the last sync_version() call."""
+        return self._version
@@ -0,0 +1,85 @@
+#rollups.py
+import numpy as np
+import pandas as pd
+
+from frames import compact_int_dtype
+
+# Group keys of batch_rollup; package_rollup adds package_tenths
+ROLLUP_KEYS = ['course_batch', 'enrollment_year', 'placement_status']
+
+# Package percentiles shown per group, read off the 0.1 LPA histogram
+PACKAGE_PERCENTILES = (50, 75, 90)
+
+
+def package_percentiles(packages):
+    """
+    Placement package percentiles per group from package_rollup rows
+    (group keys, package_tenths, students), accurate to the 0.1 LPA bucket.
+    """
+    columns = [f"package_p{p}" for p in PACKAGE_PERCENTILES]
+    if packages.empty:
+        return pd.DataFrame(columns=ROLLUP_KEYS + columns)
+
+    packages = packages.sort_values(ROLLUP_KEYS + ['package_tenths'], ignore_index=True)
+    counts = packages['students'].astype('int64')
+    groups = [packages[key] for key in ROLLUP_KEYS]
+    cumulative = counts.groupby(groups, observed=True, dropna=False).cumsum()
+    totals = counts.groupby(groups, observed=True, dropna=False).transform('sum')
+
+    result = packages[ROLLUP_KEYS].drop_duplicates(ignore_index=True)
+    for p, column in zip(PACKAGE_PERCENTILES, columns):
+        # First bucket (in package order) whose running count reaches p% of the group
+        reached = packages.loc[cumulative >= totals * p / 100, ROLLUP_KEYS + ['package_tenths']]
+        first = reached.drop_duplicates(ROLLUP_KEYS)
+        first = first.assign(**{column: first['package_tenths'].astype('float64') / 10}).drop(columns='package_tenths')
+        result = result.merge(first, on=ROLLUP_KEYS, how='left')
+    return result
+
+
+def batch_summary(groups, packages):
+    """
+    The Batch Analytics table: one row per batch_rollup group with averages
+    derived from its sums and the package percentiles, so building it costs
+    O(groups) whatever the number of students.
+    """
+    problems_count = groups['problems_count'].astype('float64')
+    soft_skill_count = groups['soft_skill_count'].astype('float64')
+    problems_min = pd.to_numeric(groups['problems_min'])
+    problems_max = pd.to_numeric(groups['problems_max'])
+    # Nullable, since a group can have no problems_solved values at all
+    problems_dtype = compact_int_dtype('problems_solved', problems_min.min(), problems_max.max()).capitalize()
+    summary = groups[ROLLUP_KEYS].assign(
+        students=groups['students'].astype('int64'),
+        avg_problems=(groups['problems_sum'].astype('float64') / problems_count.where(problems_count > 0)).round(2),
+        min_problems=pd.array(problems_min, dtype=problems_dtype),
+        max_problems=pd.array(problems_max, dtype=problems_dtype),
+        avg_soft_skills=(groups['soft_skill_sum'].astype('float64')
+                         / soft_skill_count.where(soft_skill_count > 0)).round(2)
+    )
+    summary = summary.merge(package_percentiles(packages), on=ROLLUP_KEYS, how='left')
+    return summary.sort_values(ROLLUP_KEYS, ignore_index=True)
+
+
+def rollup_frames(cohort):
+    """
+    batch_rollup and package_rollup equivalents computed from a joined
+    per-student frame (the CSV backend's cohort).
+    """
+    groups = (cohort
+              .groupby(ROLLUP_KEYS, as_index=False, observed=True, dropna=False)
+              .agg(students=('student_id', 'size'),
+                   problems_count=('problems_solved', 'count'),
+                   problems_sum=('problems_solved', 'sum'),
+                   problems_min=('problems_solved', 'min'),
+                   problems_max=('problems_solved', 'max'),
+                   soft_skill_count=('soft_skill_avg', 'count'),
+                   soft_skill_sum=('soft_skill_avg', 'sum')))
+
+    placed = cohort.loc[cohort['placement_package'].notna(), ROLLUP_KEYS]
+    # Rounded before the floor so e.g. 2.3 LPA lands in bucket 23, as in SQL
+    tenths = np.floor((cohort.loc[placed.index, 'placement_package'] * 10).round(6)).astype('int32')
+    packages = (placed.assign(package_tenths=tenths)
+                .groupby(ROLLUP_KEYS + ['package_tenths'], as_index=False, observed=True, dropna=False)
+                .size()
+                .rename(columns={'size': 'students'}))
+    return groups, packages
@@ -0,0 +1,36 @@
+#scoring.py
+# Largest value each column can take in the generated data; features are
+# divided by these so every one contributes on a 0-1 scale
+FEATURE_SCALES = {
+    'communication': 100,
+    'teamwork': 100,
+    'presentation': 100,
+    'leadership': 100,
+    'critical_thinking': 100,
+    'interpersonal_skills': 100,
+    'problems_solved': 600,
+    'mini_projects': 10,
+    'certifications_earned': 5,
+    'mock_interview_score': 100,
+    'internships_completed': 3,
+    'latest_project_score': 100
+}
+
+# Default weights of the readiness score (they sum to 1)
+READINESS_WEIGHTS = {
+    'communication': 0.05,
+    'teamwork': 0.05,
+    'presentation': 0.05,
+    'leadership': 0.05,
+    'critical_thinking': 0.05,
+    'interpersonal_skills': 0.05,
+    'problems_solved': 0.20,
+    'mini_projects': 0.10,
+    'certifications_earned': 0.05,
+    'mock_interview_score': 0.15,
+    'internships_completed': 0.10,
+    'latest_project_score': 0.10
+}
+
+FEATURES = list(FEATURE_SCALES)
+
@@ -0,0 +1,279 @@
+#student_store.py
+import sys
+import math
+import threading
+
+import numpy as np
+
+from frames import INT_COLUMNS
+from scoring import FEATURE_SCALES, READINESS_WEIGHTS, FEATURES
+
+# Columns of the store, in the order upsert_rows() takes them (see
+# STUDENT_STORE_SQL). Names and contact details are not kept resident;
+# views fetch them by student_id for the rows they show.
+STORE_COLUMNS = [
+    'student_id', 'course_batch', 'enrollment_year', 'placement_status',
+    'language', 'problems_solved', 'assessments_completed', 'mini_projects',
+    'certifications_earned', 'latest_project_score',
+    'communication', 'teamwork', 'presentation', 'leadership',
+    'critical_thinking', 'interpersonal_skills', 'soft_skill_avg',
+    'mock_interview_score', 'internships_completed', 'interview_rounds_cleared',
+    'company_name', 'package_lpa'
+]
+# Repeated strings, dictionary-encoded; the code -1 stands for NULL
+CODED_COLUMNS = {'course_batch': 'int16', 'placement_status': 'int16', 'language': 'int16', 'company_name': 'int32'}
+# Two-decimal values kept exactly as integer hundredths; -1 stands for NULL
+CENTI_COLUMNS = {'soft_skill_avg': 'int16', 'package_lpa': 'int32'}
+# Every other column is a small non-negative integer typed as in frames.INT_COLUMNS; -1 stands for NULL.
+# A column is widened to int64 once a value does not fit its compact dtype
+
+# Thresholds of the criteria filter, in the order filter() takes them after the course
+CRITERIA_COLUMNS = ('problems_solved', 'mini_projects', 'soft_skill_avg')
+
+
+class StudentStore:
+    """
+    Compact, process-wide copy of the joined student record in
+    struct-of-arrays form: one NumPy array per column, sorted by student_id,
+    with strings replaced by dictionary codes. That is about 45 bytes per
+    student instead of a dict per row, plus ~15 for the criteria index.
+    filter() binary-searches per-course sorted orders, so its latency stays
+    flat as the cohort grows; match_drives() and top_k() scan the arrays
+    vectorised. upsert_rows() applies loads incrementally.
+    """
+
+    def __init__(self):
+        self.columns = {
+            name: np.empty(0, dtype=CODED_COLUMNS.get(name) or CENTI_COLUMNS.get(name) or INT_COLUMNS[name])
+            for name in STORE_COLUMNS
+        }
+        self.dictionaries = {name: {} for name in CODED_COLUMNS}  # value -> code
+        self.values = {name: [] for name in CODED_COLUMNS}        # code -> value
+        self._criteria_index = None  # see _build_criteria_index(); dropped by upsert_rows()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.columns['student_id'])
+
+    def _encode(self, name, values):
+        if name in CODED_COLUMNS:
+            codes, decoded = self.dictionaries[name], self.values[name]
+            encoded = []
+            for value in values:
+                if value is None:
+                    encoded.append(-1)
+                    continue
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(decoded)
+                    decoded.append(sys.intern(value))
+                encoded.append(code)
+            return np.array(encoded, dtype=CODED_COLUMNS[name])
+        if name in CENTI_COLUMNS:
+            dtype = CENTI_COLUMNS[name]
+            values = [-1 if value is None else round(float(value) * 100) for value in values]
+        else:
+            dtype = INT_COLUMNS[name]
+            if None in values:
+                values = [-1 if value is None else value for value in values]
+        try:
+            return np.array(values, dtype=dtype)
+        except OverflowError:
+            # Out of the compact dtype's range (changesets and imports can carry
+            # any INT); upsert_rows() widens the stored column to match
+            return np.array(values, dtype=np.int64)
+
+    def upsert_rows(self, rows):
+        """Adds or replaces students from rows in STORE_COLUMNS order; later rows win."""
+        rows = list(rows)
+        if not rows:
+            return
+        with self._lock:
+            batch = {name: self._encode(name, values) for name, values in zip(STORE_COLUMNS, zip(*rows))}
+            self._criteria_index = None
+            for name, values in batch.items():
+                if values.dtype.itemsize > self.columns[name].dtype.itemsize:
+                    self.columns[name] = self.columns[name].astype(values.dtype)
+
+            # Keep the last row of every student_id in the batch
+            ids = batch['student_id']
+            unique_ids, last = np.unique(ids[::-1], return_index=True)
+            picks = len(ids) - 1 - last
+
+            existing = self.columns['student_id']
+            positions = np.searchsorted(existing, unique_ids)
+            found = positions < len(existing)
+            found[found] = existing[positions[found]] == unique_ids[found]
+
+            for name, column in self.columns.items():
+                column[positions[found]] = batch[name][picks[found]]
+
+            if not found.all():
+                added = picks[~found]
+                appended_sorted = not len(existing) or unique_ids[~found][0] > existing[-1]
+                merged = {name: np.concatenate([column, batch[name][added]]) for name, column in self.columns.items()}
+                if not appended_sorted:
+                    order = np.argsort(merged['student_id'], kind='stable')
+                    merged = {name: column[order] for name, column in merged.items()}
+                self.columns = merged
+
+    def _code(self, name, value):
+        return self.dictionaries[name].get(value, -2)  # -2 matches nothing
+
+    def _build_criteria_index(self):
+        """
+        For every criteria column, the row positions of the non-placed
+        students ordered by (course, value) and the values in that order, so
+        each course is one contiguous, sorted segment. Rebuilt by the first
+        filter() after a load: one lexsort per column.
+        """
+        columns = self.columns
+        rows = np.flatnonzero((columns['course_batch'] >= 0)
+                              & (columns['placement_status'] != self._code('placement_status', 'Placed')))
+        courses = columns['course_batch'][rows]
+        orders, values = [], []
+        for name in CRITERIA_COLUMNS:
+            order = rows[np.lexsort((columns[name][rows], courses))].astype(np.int32)
+            orders.append(order)
+            values.append(columns[name][order])
+        # Segment of course code c: bounds[c]:bounds[c + 1]
+        bounds = np.searchsorted(np.sort(courses), np.arange(len(self.values['course_batch']) + 1))
+        self._criteria_index = (bounds, orders, values)
+
+    def filter(self, course, min_problems, min_projects, min_soft_skill_avg):
+        """
+        Returns the sorted student_ids of non-placed students of course
+        meeting every threshold. Each threshold is a binary search in the
+        course's sorted segment; only the smallest matching suffix is then
+        checked against the other thresholds.
+        """
+        thresholds = (min_problems, min_projects, math.ceil(round(min_soft_skill_avg * 100, 6)))
+        with self._lock:
+            if self._criteria_index is None:
+                self._build_criteria_index()
+            bounds, orders, values = self._criteria_index
+            code = self._code('course_batch', course)
+            if code < 0:
+                return self.columns['student_id'][:0]
+
+            low, high = bounds[code], bounds[code + 1]
+            starts = [low + np.searchsorted(column[low:high], threshold)
+                      for column, threshold in zip(values, thresholds)]
+            narrowest = int(np.argmax(starts))
+            candidates = orders[narrowest][starts[narrowest]:high]
+            mask = np.ones(len(candidates), dtype=bool)
+            for i, (name, threshold) in enumerate(zip(CRITERIA_COLUMNS, thresholds)):
+                if i != narrowest:
+                    mask &= self.columns[name][candidates] >= threshold
+            # Row positions follow student_id order
+            return self.columns['student_id'][np.sort(candidates[mask])]
+
+    def match_drives(self, drives, chunk_size=1 << 22):
+        """
+        Evaluates many criteria sets at once. drives is a sequence of
+        (course, min_problems, min_projects, min_soft_skill_avg) tuples with
+        the semantics of filter(). Students are ranked against the distinct
+        cutoffs of each criterion, so all students sharing a course and ranks
+        match the same drives and each such cell is compared with its
+        course's drives once (about chunk_size comparisons at a time). Returns
+        (student_ids, drive_indexes) with one entry per qualifying
+        (student, drive) pair, ordered by student_id then drive.
+        """
+        drives = list(drives)
+        courses = np.array([self._code('course_batch', course) for course, *_ in drives], dtype=np.int32)
+        cutoffs = {
+            'problems_solved': np.array([drive[1] for drive in drives], dtype=np.float64),
+            'mini_projects': np.array([drive[2] for drive in drives], dtype=np.float64),
+            'soft_skill_avg': np.array([math.ceil(round(drive[3] * 100, 6)) for drive in drives], dtype=np.int64)
+        }
+
+        with self._lock:
+            columns = self.columns
+            candidates = np.flatnonzero(np.isin(columns['course_batch'], courses)
+                                        & (columns['placement_status'] != self._code('placement_status', 'Placed')))
+
+            # A student meets a cutoff iff its rank (cutoffs <= value) exceeds the cutoff's position
+            course_codes = np.unique(courses)
+            student_course = np.searchsorted(course_codes, columns['course_batch'][candidates])
+            drive_course = np.searchsorted(course_codes, courses)
+            cells = student_course.astype(np.int64)
+            student_ranks, drive_ranks = [], []
+            for name, values in cutoffs.items():
+                distinct = np.unique(values)
+                student_ranks.append(np.searchsorted(distinct, columns[name][candidates], side='right'))
+                drive_ranks.append(np.searchsorted(distinct, values))
+                cells = cells * (len(distinct) + 1) + student_ranks[-1]
+            cells, first, inverse = np.unique(cells, return_index=True, return_inverse=True)
+
+            # Matching drives of every cell, from its first student; cells are
+            # ordered by course, so each course's cells are a contiguous range
+            cell_hits, hit_drives = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+            bounds = np.searchsorted(student_course[first], np.arange(len(course_codes) + 1))
+            for course in range(len(course_codes)):
+                course_drives = np.flatnonzero(drive_course == course)
+                step = max(1, chunk_size // len(course_drives))
+                for start in range(bounds[course], bounds[course + 1], step):
+                    sample = first[start:min(start + step, bounds[course + 1])]
+                    hits = student_ranks[0][sample, None] > drive_ranks[0][course_drives]
+                    for ranks, drive_rank in zip(student_ranks[1:], drive_ranks[1:]):
+                        hits &= ranks[sample, None] > drive_rank[course_drives]
+                    rows, matched = np.nonzero(hits)
+                    cell_hits.append(rows + start)
+                    hit_drives.append(course_drives[matched])
+            cell_hits, hit_drives = np.concatenate(cell_hits), np.concatenate(hit_drives)
+
+            # Expand to one (student, drive) pair per hit of the student's cell
+            per_cell = np.bincount(cell_hits, minlength=len(cells))
+            per_student = per_cell[inverse]
+            offsets = (np.cumsum(per_cell) - per_cell)[inverse] - (np.cumsum(per_student) - per_student)
+            positions = np.arange(per_student.sum()) + np.repeat(offsets, per_student)
+            return columns['student_id'][np.repeat(candidates, per_student)], hit_drives[positions]
+
+    def top_k(self, k, weights=None, status=None):
+        """
+        Returns (student_ids, readiness scores) of the k best weighted
+        readiness scores (0-100, highest first), optionally only among
+        students with the given placement status: the weighted sum of the
+        FEATURES scaled to 0-1 by FEATURE_SCALES, computed from the resident
+        int8/int16 columns.
+        """
+        weights = {**READINESS_WEIGHTS, **(weights or {})}
+        total = sum(weights[name] for name in FEATURES)
+        with self._lock:
+            columns = self.columns
+            if status is not None:
+                candidates = np.flatnonzero(columns['placement_status'] == self._code('placement_status', status))
+            else:
+                candidates = np.arange(len(self))
+            k = min(k, len(candidates))
+            if k == 0 or total <= 0:
+                return columns['student_id'][candidates[:k]], np.zeros(k, dtype=np.float64)
+
+            scores = np.zeros(len(candidates), dtype=np.float32)
+            for name in FEATURES:
+                if weights[name]:
+                    # NULL (-1) counts as 0
+                    values = np.maximum(columns[name][candidates], 0).astype(np.float32)
+                    scores += values * np.float32(weights[name] * 100 / total / FEATURE_SCALES[name])
+
+            best = np.argpartition(scores, len(scores) - k)[-k:]
+            best = best[np.argsort(scores[best])[::-1]]
+            return columns['student_id'][candidates[best]], np.round(scores[best].astype(np.float64), 2)
+
+    def stats(self):
+        """Resident size: column arrays (and the criteria index once built) plus the interned dictionary strings."""
+        with self._lock:
+            array_bytes = sum(column.nbytes for column in self.columns.values())
+            if self._criteria_index is not None:
+                bounds, orders, values = self._criteria_index
+                array_bytes += bounds.nbytes + sum(array.nbytes for array in orders + values)
+            dictionary_bytes = sum(sys.getsizeof(codes) + sum(sys.getsizeof(value) for value in codes)
+                                   for codes in self.dictionaries.values())
+            dictionary_bytes += sum(sys.getsizeof(values) for values in self.values.values())
+            students = len(self)
+        return {
+            'students': students,
+            'array_bytes': array_bytes,
+            'dictionary_bytes': dictionary_bytes,
+            'bytes_per_student': round((array_bytes + dictionary_bytes) / students, 1) if students else None
+        }